@@ -41,12 +41,41 @@ if not os.path.exists(USER_BUILDS_FILE):
 BEHAVIOR_MODEL_PATH = os.path.join(USER_DIR, 'skill_vectors.model')
 SEMANTIC_MODEL_PATH = os.path.join(USER_DIR, 'description_embeddings.pt')
 
+# 4. Pre-scaled Icon Cache (Writeable, survives restarts; created on the first write)
+ICON_CACHE_DIR = os.path.join(USER_DIR, 'icon_cache')
+ICON_CACHE_DIR_SEP = ICON_CACHE_DIR + os.sep
+ICON_CACHE_FILES = set(os.listdir(ICON_CACHE_DIR)) if os.path.isdir(ICON_CACHE_DIR) else set()
+
 # --- Static Data (Bundled in EXE) ---
 DB_FILE = resource_path('master.db') 
 AQ_DB_FILE = resource_path('skills_aq.db')
 ICON_DIR = resource_path(os.path.join('icons', 'skill_icons'))
+ICON_DIR_SEP = ICON_DIR + os.sep
+
+def _index_icon_dir(icon_dir):
+    """
+    Maps icon filename -> full path. Accepts a flat folder or one level of
+    shard subfolders (e.g. skill_icons/12/123.jpg) so large icon sets can be split up.
+    """
+    index = {}
+    if not os.path.isdir(icon_dir):
+        return index
+    for entry in os.scandir(icon_dir):
+        if entry.is_dir():
+            for sub in os.scandir(entry.path):
+                index[sub.name] = sub.path
+        else:
+            index[entry.name] = entry.path
+    return index
+
+# Scanned once so icon lookups are a dict lookup instead of a stat() per skill
+ICON_FILES = _index_icon_dir(ICON_DIR)
+
+def icon_path(filename):
+    """ Returns the on-disk path for a skill icon, wherever it lives under ICON_DIR. """
+    return ICON_FILES.get(filename) or ICON_DIR_SEP + filename
 ICON_SIZE = 64
-PIXMAP_CACHE = {}
+DRAG_CURSOR_SIZE = ICON_SIZE # Drag pixmaps share the bar's cached icon size
 
 PROF_MAP = {
     0: "No Profession", 1: "Warrior", 2: "Ranger", 3: "Monk", 4: "Necromancer",
@@ -60,6 +89,9 @@ PROF_SHORT_MAP = {
     "Assassin": "A", "Ritualist": "Rt", "Paragon": "P", "Dervish": "D"
 }
 
+# Build profession codes (stored as strings) straight to their short label
+PROF_CODE_TO_SHORT = {str(k): PROF_SHORT_MAP.get(v, "X") for k, v in PROF_MAP.items()}
+
 ATTR_MAP = {
     -9: "Norn Rank", -8: "Ebon Vanguard Rank", -7: "Dwarven Rank", -6: "Asuran Rank",
     -5: "Kurzick Rank", -4: "Luxon Rank", -3: "Lightbringer Rank", -2: "Sunspear Rank",
@@ -1,9 +1,27 @@
 import sqlite3
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.models import Skill
 from src.constants import AQ_DB_FILE
 
 class SkillRepository:
+    # We always want is_pve_only from the main 'skills' table because 'skills_pvp' 
+    # often has incorrect or missing data for that specific field.
+    _SELECT_PVP = """
+        SELECT p.skill_id, p.name, p.profession, p.attribute, 
+               p.energy_cost, p.activation, p.recharge, p.adrenaline, s.is_pve_only,
+               p.description, p.is_elite,
+               s.health_cost, s.aftercast, s.combo_req, s.is_touch, s.campaign, s.in_pre, s.skill_type
+        FROM skills_pvp p
+        JOIN skills s ON p.skill_id = s.skill_id
+    """
+    _SELECT_PVE = """
+        SELECT skill_id, name, profession, attribute, 
+               energy_cost, activation, recharge, adrenaline, is_pve_only,
+               description, is_elite,
+               health_cost, aftercast, combo_req, is_touch, campaign, in_pre, skill_type
+        FROM skills
+    """
+
     def __init__(self, db_path):
         self.conn = sqlite3.connect(db_path)
         self.cursor = self.conn.cursor()
@@ -32,27 +50,10 @@ class SkillRepository:
         if cache_key in self._cache:
             return self._cache[cache_key]
         
-        # We always want is_pve_only from the main 'skills' table because 'skills_pvp' 
-        # often has incorrect or missing data for that specific field.
         if is_pvp:
-            query_full = """
-                SELECT p.skill_id, p.name, p.profession, p.attribute, 
-                       p.energy_cost, p.activation, p.recharge, p.adrenaline, s.is_pve_only,
-                       p.description, p.is_elite,
-                       s.health_cost, s.aftercast, s.combo_req, s.is_touch, s.campaign, s.in_pre, s.skill_type
-                FROM skills_pvp p
-                JOIN skills s ON p.skill_id = s.skill_id
-                WHERE p.skill_id=?
-            """
+            query_full = self._SELECT_PVP + " WHERE p.skill_id=?"
         else:
-            query_full = """
-                SELECT skill_id, name, profession, attribute, 
-                       energy_cost, activation, recharge, adrenaline, is_pve_only,
-                       description, is_elite,
-                       health_cost, aftercast, combo_req, is_touch, campaign, in_pre, skill_type
-                FROM skills
-                WHERE skill_id=?
-            """
+            query_full = self._SELECT_PVE + " WHERE skill_id=?"
         
         try:
             self.cursor.execute(query_full, (skill_id,))
@@ -70,6 +71,44 @@ class SkillRepository:
                 
         return None
 
+    def get_skills(self, ids: List[int], is_pvp: bool = False) -> Dict[int, Skill]:
+        """
+        Batched get_skill. Returns {skill_id: Skill} for every id that exists;
+        uncached skills are fetched with a single IN (...) query.
+        """
+        result = {}
+        missing = []
+        for sid in dict.fromkeys(ids):
+            skill = self._cache.get((sid, is_pvp))
+            if skill:
+                result[sid] = skill
+            else:
+                missing.append(sid)
+        
+        if not missing:
+            return result
+        
+        placeholders = ",".join("?" * len(missing))
+        if is_pvp:
+            query = f"{self._SELECT_PVP} WHERE p.skill_id IN ({placeholders})"
+        else:
+            query = f"{self._SELECT_PVE} WHERE skill_id IN ({placeholders})"
+        
+        try:
+            self.cursor.execute(query, missing)
+            rows = self.cursor.fetchall()
+        except sqlite3.OperationalError:
+            # Older DB versions: let get_skill handle its per-skill fallbacks
+            rows = []
+            for sid in missing:
+                skill = self.get_skill(sid, is_pvp=is_pvp)
+                if skill:
+                    result[sid] = skill
+        
+        for row in rows:
+            result[row[0]] = self._create_skill_object(row, is_pvp, (row[0], is_pvp))
+        return result
+
     def _fetch_hybrid_skill(self, skill_id, cache_key):
         """
         Fetches Text/Basic Stats from PvP table (for UI),
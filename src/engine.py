@@ -2,7 +2,7 @@ import sqlite3
 import json
 import os
 import collections
-from typing import List, Set, Tuple
+from typing import Dict, List, Set, Tuple
 from collections import Counter
 from src.skill2vec import SkillBrain
 from src.utils import GuildWarsTemplateDecoder
@@ -804,6 +804,9 @@ class MechanicsEngine:
 
 class SynergyEngine:
     def __init__(self, json_path, db_path):
+        # (version, {team: builds}); stale once invalidate_team_index bumps _builds_version
+        self._team_index: Tuple[int, Dict[str, List[Build]]] = (-1, {})
+        self._builds_version = 0
         self.builds: List[Build] = []
         self.professions = set()
         self.categories = {"User Imported", "User Created"}
@@ -863,10 +866,47 @@ class SynergyEngine:
         process_file(USER_BUILDS_FILE, is_user_data=True)
         # Process system data
         process_file(json_path, is_user_data=False)
+        self.invalidate_team_index()
 
         # Retrain behavioral model using both system and user data
         self.brain.train([json_path, USER_BUILDS_FILE], self.mechanics.db_path)
 
+    @property
+    def builds(self) -> List[Build]:
+        return self._builds
+
+    @builds.setter
+    def builds(self, builds):
+        # Replacing the list always invalidates; in-place edits call invalidate_team_index()
+        self._builds = builds
+        self.invalidate_team_index()
+
+    @property
+    def builds_by_team(self) -> Dict[str, List[Build]]:
+        """
+        {team name: builds in list order}, rebuilt on first use after invalidate_team_index().
+        Treat it as read-only; use get_team_builds for a list you can modify.
+        """
+        version = self._builds_version
+        built_version, index = self._team_index
+        if built_version != version:
+            # Stamp with the version read before the scan, so a change made meanwhile
+            # still leaves the index stale
+            grouped = collections.defaultdict(list)
+            for b in self.builds:
+                grouped[b.team].append(b)
+            index = dict(grouped)
+            self._team_index = (version, index)
+        return index
+
+    def get_team_builds(self, team) -> List[Build]:
+        """ Returns a new list of team's builds in list order. """
+        return list(self.builds_by_team.get(team, ()))
+
+    def invalidate_team_index(self):
+        """ Call after adding, removing or reordering builds in place, or changing a build's team. """
+        self._builds_version += 1
+
     def save_user_builds(self):
         user_data = []
         for b in self.builds:
@@ -1206,9 +1246,12 @@ class SynergyEngine:
         print(f"[Engine] Final Results: {len(final_results)}")
         return final_results
 
-    def filter_skills(self, prof=None, category=None, team=None) -> Set[int]:
+    def filter_skills(self, prof=None, category=None, team=None, builds=None) -> Set[int]:
+        """ builds: optional snapshot to scan instead of the live list, for use off the GUI thread. """
         valid_ids = set()
-        for b in self.builds:
+        if builds is None:
+            builds = self.builds_by_team.get(team, ()) if team and team != "All" else self.builds
+        for b in builds:
             if prof and prof != "All" and b.primary_prof != prof:
                 continue
             if category and category != "All" and b.category != category:
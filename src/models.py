@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List
 from src.constants import PROF_MAP, ATTR_MAP
 from src.core.mechanics import get_primary_bonus_value
@@ -31,6 +32,9 @@ class Skill:
     def __post_init__(self):
         if not self.original_description:
             self.original_description = self.description
+        # Icon lookups key on the full filename, so guarantee the extension once here
+        if not self.icon_filename.lower().endswith('.jpg'):
+            self.icon_filename += '.jpg'
 
     def get_profession_str(self):
         return PROF_MAP.get(self.profession, f"Unknown ({self.profession})")
@@ -125,6 +129,26 @@ class Skill:
             
         return round(rech, 1)
 
+    def get_effective_stats(self, rank: int, bonuses: dict = None, global_act: float = 0.0, global_rech: float = 0.0) -> tuple:
+        """
+        Returns (energy, activation, recharge) after bonuses. Results are cached, so
+        re-showing the same skill at the same rank and bonuses is a lookup.
+        """
+        bonuses_key = tuple(sorted(bonuses.items())) if bonuses else ()
+        # PvE/PvP variants share an id, so the stat fields the get_effective_* methods read are keyed too
+        key = (self.id, self.energy, self.activation, self.recharge, self.profession, self.skill_type,
+               "type_enchantment" in self.tags, rank, bonuses_key, global_act, global_rech)
+        stats = _EFFECTIVE_STATS.get(key)
+        if stats is None:
+            if len(_EFFECTIVE_STATS) >= _EFFECTIVE_STATS_MAX:
+                _EFFECTIVE_STATS.clear()
+            stats = _EFFECTIVE_STATS[key] = (
+                self.get_effective_energy(rank, bonuses),
+                self.get_effective_activation(rank, bonuses, global_act),
+                self.get_effective_recharge(rank, bonuses, global_rech),
+            )
+        return stats
+
     def get_description_for_rank(self, rank: int, bonuses: dict = None) -> str:
         """
         Dynamically substitutes variables in the description based on the provided attribute rank.
@@ -204,6 +228,10 @@ class Skill:
                     
         return current_desc
 
+# Skill.get_effective_stats results; cleared when full rather than tracking recency
+_EFFECTIVE_STATS = {}
+_EFFECTIVE_STATS_MAX = 2048
+
 @dataclass
 class Build:
     code: str
@@ -219,5 +247,19 @@ class Build:
     def __hash__(self):
         return id(self)
 
+    @property
+    def prof_names(self) -> tuple:
+        """
+        Returns (primary, secondary) profession names. Memoized on the stored codes,
+        so it stays correct when the professions are reassigned.
+        """
+        return _prof_names(self.primary_prof, self.secondary_prof)
+
     def __eq__(self, other):
         return isinstance(other, Build) and id(self) == id(other)
+
+@lru_cache(maxsize=256)
+def _prof_names(primary_prof, secondary_prof):
+    p1 = PROF_MAP.get(int(primary_prof) if primary_prof.isdigit() else 0, "X")
+    p2 = PROF_MAP.get(int(secondary_prof) if secondary_prof.isdigit() else 0, "X")
+    return p1, p2
@@ -8,6 +8,20 @@ from PyQt6.QtGui import QIcon, QPixmap
 from src.constants import resource_path, PROF_MAP
 from src.ui.theme import get_color
 
+# icon folder -> filenames in it, listed once so each button is a set lookup instead of a stat()
+_ICON_DIR_FILES = {}
+
+def _find_icon(icon_dir, name):
+    """ Returns the path of icons/<icon_dir>/<name>, or None if the file isn't there. """
+    files = _ICON_DIR_FILES.get(icon_dir)
+    if files is None:
+        folder = resource_path(os.path.join("icons", icon_dir))
+        files = frozenset(os.listdir(folder)) if os.path.isdir(folder) else frozenset()
+        _ICON_DIR_FILES[icon_dir] = files
+    if name in files:
+        return resource_path(os.path.join("icons", icon_dir, name))
+    return None
+
 # --- Data Definitions ---
 
 CONSUMABLES = {
@@ -111,8 +125,8 @@ class ConsumableItem(QPushButton):
         tooltip = f"<b>{data['name']}</b><br/><br/>{self._format_stats(data['stats'])}"
         self.setToolTip(tooltip)
         
-        icon_path = resource_path(os.path.join("icons", "cons_icons", data['icon']))
-        if os.path.exists(icon_path):
+        icon_path = _find_icon("cons_icons", data['icon'])
+        if icon_path:
             self.setIcon(QIcon(icon_path))
         else:
             self.setText(data['name'][:2])
@@ -195,8 +209,8 @@ class RuneItem(QPushButton):
         self.setToolTip(f"<b>{name}</b>")
         
         if icon_name:
-            icon_path = resource_path(os.path.join("icons", icon_dir, icon_name))
-            if os.path.exists(icon_path):
+            icon_path = _find_icon(icon_dir, icon_name)
+            if icon_path:
                 self.setIcon(QIcon(icon_path))
                 self.setIconSize(QSize(56, 56))
             else:
@@ -1,13 +1,315 @@
 import os
+import re
+import threading
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
 from PyQt6.QtWidgets import (
-    QLabel, QFrame, QVBoxLayout, QHBoxLayout, QPushButton, QSizePolicy, QListWidget, QStyle, QStyledItemDelegate, QListWidgetItem, QAbstractItemView, QScrollArea, QWidget, QApplication
+    QLabel, QFrame, QVBoxLayout, QHBoxLayout, QPushButton, QSizePolicy, QListWidget, QStyle, QStyledItemDelegate, QListWidgetItem, QAbstractItemView, QScrollArea, QWidget, QApplication, QToolTip
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QMimeData, QPoint, QSize, QRect, QUrl
-from PyQt6.QtGui import QDrag, QPixmap, QPainter, QColor, QFont, QIcon, QDesktopServices
+from PyQt6.QtCore import Qt, QEvent, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, QMimeData, QPoint, QPointF, QSize, QRect, QUrl
+from PyQt6.QtGui import QDrag, QPixmap, QImage, QPainter, QPen, QBrush, QColor, QFont, QRegion, QPixmapCache, QDesktopServices, QStaticText, QTextOption
 
-from src.constants import ICON_DIR, ICON_SIZE, ATTR_MAP, PROF_MAP, PROF_SHORT_MAP, PIXMAP_CACHE
+from src.constants import ICON_FILES, icon_path, ICON_CACHE_DIR, ICON_CACHE_DIR_SEP, ICON_CACHE_FILES, ICON_SIZE, DRAG_CURSOR_SIZE, ATTR_MAP, PROF_CODE_TO_SHORT
 from src.models import Skill, Build
-from src.ui.theme import get_color
+from src.ui import theme
+from src.ui.theme import get_color, get_theme_snapshot, THEME_SIGNALS
+
+def _make_ghost(pix):
+    """
+    Returns a 40% opacity (ghost) copy of pix for suggested skills.
+    Callers cache the result next to the opaque pixmap.
+    """
+    transparent_pix = QPixmap(pix.size())
+    transparent_pix.fill(Qt.GlobalColor.transparent)
+    p = QPainter(transparent_pix)
+    p.setOpacity(0.4)
+    p.drawPixmap(0, 0, pix)
+    p.end()
+    return transparent_pix
+
+# Scaled icons live in Qt's LRU QPixmapCache (GUI thread only), bounded so browsing every
+# icon at both sizes can't grow memory without limit. The limit is in KB.
+QPixmapCache.setCacheLimit(64 * 1024)
+
+# While an icon size change is in flight, cache misses are scaled with FastTransformation
+# under a "_fast" key. set_interactive(False) drops those so the next lookup is smooth.
+_interactive = False
+_FAST_KEYS = set()
+
+def set_interactive(active):
+    """
+    Switches fast in-flight scaling on or off. Returns True when turning it off discarded
+    fast pixmaps, i.e. when widgets showing icons should fetch them again.
+    """
+    global _interactive
+    _interactive = active
+    if active or not _FAST_KEYS:
+        return False
+    for key in _FAST_KEYS:
+        QPixmapCache.remove(key)
+    _FAST_KEYS.clear()
+    return True
+
+@lru_cache(maxsize=4096)
+def _pixmap_key(icon_file, size, ghost=False):
+    """ QPixmapCache key for icon_file at size; memoized so repaints don't rebuild the string. """
+    return f"{icon_file}_{size}_ghost" if ghost else f"{icon_file}_{size}"
+
+def _get_icon_pixmap(icon_file, size, ghost=False):
+    """
+    Returns icon_file scaled to size (optionally ghosted) from QPixmapCache, loading it
+    only on the first request. Shared by the bar, the library, build previews and the
+    info panel. None if the icon is missing.
+    """
+    cache_key = _pixmap_key(icon_file, size, ghost)
+    pix = QPixmapCache.find(cache_key)
+    if pix is not None:
+        return pix
+    if _interactive:
+        pix = QPixmapCache.find(cache_key + "_fast")
+        if pix is not None:
+            return pix
+
+    if ghost:
+        opaque = _get_icon_pixmap(icon_file, size)
+        if opaque is None:
+            return None
+        pix = _make_ghost(opaque)
+        smooth = QPixmapCache.find(_pixmap_key(icon_file, size)) is not None
+    else:
+        if icon_file not in ICON_FILES:
+            return None
+        pix, smooth = _load_scaled_icon(icon_file, size, fast=_interactive)
+
+    if not smooth:
+        cache_key += "_fast"
+        _FAST_KEYS.add(cache_key)
+    QPixmapCache.insert(cache_key, pix)
+    return pix
+
+def _load_scaled_icon(icon_file, size, fast=False):
+    """ Returns (pixmap, smooth) for icon_file scaled to size; see _load_scaled_image. """
+    img, smooth = _load_scaled_image(icon_file, size, fast)
+    return QPixmap.fromImage(img), smooth
+
+# Guards ICON_CACHE_FILES and the PNG writes, which now also happen on pool threads
+_DISK_CACHE_LOCK = threading.Lock()
+
+@lru_cache(maxsize=512)
+def _source_image(icon_file):
+    """
+    Decoded full-size icon, kept so a size change (or the smooth pass after a fast one)
+    rescales from memory instead of decoding the file again. QImage copies are shared
+    read-only, so pool threads can scale the same source at once.
+    """
+    return QImage(icon_path(icon_file))
+
+@lru_cache(maxsize=None)
+def _source_stamp(icon_file):
+    """
+    mtime and byte size of the source icon, baked into its disk cache names so an icon
+    replaced under the same filename (e.g. by an app update) is rescaled, not served stale.
+    """
+    try:
+        st = os.stat(icon_path(icon_file))
+    except OSError:
+        return "0"
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
+def _load_scaled_image(icon_file, size, fast=False):
+    """
+    Returns (image, smooth) for icon_file scaled to size. Smooth copies are written to
+    ICON_CACHE_DIR so later sessions load them directly instead of re-running
+    SmoothTransformation; fast ones are never saved. Only touches QImage, so it is safe
+    to run off the GUI thread.
+    """
+    cached_name = f"{icon_file}.{_source_stamp(icon_file)}.{size}.png"
+    if cached_name in ICON_CACHE_FILES:
+        img = QImage(ICON_CACHE_DIR_SEP + cached_name)
+        if not img.isNull():
+            return img, True
+
+    img = _source_image(icon_file)
+    if img.width() == size and img.height() == size:
+        # Already the requested size; nothing worth caching on disk
+        return img, True
+    if fast:
+        return img.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation), False
+    img = img.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    with _DISK_CACHE_LOCK:
+        if cached_name not in ICON_CACHE_FILES:
+            os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+            if img.save(ICON_CACHE_DIR_SEP + cached_name, "PNG"):
+                _prune_disk_cache(icon_file, size)
+                ICON_CACHE_FILES.add(cached_name)
+    return img, True
+
+def _prune_disk_cache(icon_file, size):
+    """
+    Deletes copies of icon_file at size cached under an older source stamp (or the
+    unstamped legacy name), so the cache holds one file per icon and size.
+    Called with _DISK_CACHE_LOCK held.
+    """
+    prefix, suffix = f"{icon_file}.", f".{size}.png"
+    stale = [name for name in ICON_CACHE_FILES
+             if name.startswith(prefix) and name.endswith(suffix)
+             and "." not in name[len(prefix):-len(suffix)]]
+    for name in stale:
+        try:
+            os.remove(ICON_CACHE_DIR_SEP + name)
+        except OSError:
+            continue
+        ICON_CACHE_FILES.discard(name)
+
+class _IconDecodeTask(QRunnable):
+    """ Decodes and scales one icon on QThreadPool, handing the QImage back to the GUI thread. """
+    def __init__(self, icon_file, size):
+        super().__init__()
+        self.icon_file = icon_file
+        self.size = size
+
+    def run(self):
+        img, _ = _load_scaled_image(self.icon_file, self.size)
+        _icon_decoder().decoded.emit(self.icon_file, self.size, img)
+
+class _IconDecoder(QObject):
+    # Lives on the GUI thread, so emits from pool threads arrive queued
+    decoded = pyqtSignal(str, int, QImage)
+
+    def __init__(self):
+        super().__init__()
+        self.pending = {} # (icon_file, size) -> callbacks waiting on that decode
+        self.decoded.connect(self._on_decoded)
+
+    def _on_decoded(self, icon_file, size, img):
+        callbacks = self.pending.pop((icon_file, size), ())
+        cache_key = _pixmap_key(icon_file, size)
+        pix = QPixmapCache.find(cache_key)
+        if pix is None:
+            pix = QPixmap.fromImage(img)
+            QPixmapCache.insert(cache_key, pix)
+        for callback in callbacks:
+            try:
+                callback(pix)
+            except RuntimeError:
+                pass # Widget was deleted while its icon decoded
+
+_ICON_DECODER = None
+
+def _icon_decoder():
+    global _ICON_DECODER
+    if _ICON_DECODER is None:
+        _ICON_DECODER = _IconDecoder()
+    return _ICON_DECODER
+
+def load_icon_async(icon_file, size, callback):
+    """
+    Calls callback(pixmap) with icon_file at size, or callback(None) if the icon is
+    missing. Cached icons answer immediately; misses are decoded on QThreadPool and
+    answered on the GUI thread. Returns True if callback already ran.
+    """
+    pix = QPixmapCache.find(_pixmap_key(icon_file, size))
+    if pix is None and (_interactive or icon_file not in ICON_FILES):
+        pix = _get_icon_pixmap(icon_file, size) # Fast in-flight scales stay synchronous
+    if pix is not None or icon_file not in ICON_FILES:
+        callback(pix)
+        return True
+
+    decoder = _icon_decoder()
+    key = (icon_file, size)
+    if key in decoder.pending:
+        decoder.pending[key].append(callback)
+    else:
+        decoder.pending[key] = [callback]
+        QThreadPool.globalInstance().start(_IconDecodeTask(icon_file, size))
+    return False
+
+# "Missing icon" placeholders, keyed by (text, ghost, theme generation)
+_FALLBACK_PIX_CACHE = {}
+
+def _get_fallback_pixmap(text, ghost=False):
+    """ Returns the cached (optionally ghosted) "missing icon" placeholder showing text. """
+    cache_key = (text, ghost, theme.THEME_GEN)
+    pix = _FALLBACK_PIX_CACHE.get(cache_key)
+    if pix is not None:
+        return pix
+    if ghost:
+        pix = _make_ghost(_get_fallback_pixmap(text))
+        _FALLBACK_PIX_CACHE[cache_key] = pix
+        return pix
+
+    pix = QPixmap(ICON_SIZE, ICON_SIZE)
+    pix.fill(QColor(get_color("bg_hover")))
+    p = QPainter(pix)
+    p.setPen(QColor(get_color("text_primary")))
+    p.drawText(pix.rect(), Qt.AlignmentFlag.AlignCenter, text)
+    p.end()
+
+    _FALLBACK_PIX_CACHE[cache_key] = pix
+    return pix
+
+# Build reorder drags carry the source row as a little-endian int32 in this format,
+# alongside the "reorder_build:<row>" text that other drop targets check for
+_REORDER_MIME = "application/x-bookah-reorder"
+
+def _reorder_source_row(mime_data):
+    """
+    Returns the source row of a build reorder drag, or None for any other drag.
+    """
+    if mime_data.hasFormat(_REORDER_MIME):
+        return int.from_bytes(mime_data.data(_REORDER_MIME).data(), "little")
+    txt = mime_data.text() if mime_data.hasText() else ""
+    if txt.startswith("reorder_build:"):
+        return int(txt.partition(":")[2])
+    return None
+
+# SkillSlot tooltip templates, filled on hover by SkillSlot._build_tooltip
+_TT_FULL = "<b>{name}</b><br/>{attr}{type}{energy}{activation}{recharge}<br/>{desc}"
+_TT_ATTR = "<i>{attr} ({rank})</i><br/>"
+_TT_TYPE = "<i>{type}</i><br/>"
+_TT_STAT = "{label}: {base}{unit}<br/>"
+_TT_STAT_REDUCED = "{label}: <span style='color:#00FF00;'>{eff}{unit}</span> (Base: {base}{unit})<br/>"
+_TT_GHOST_HDR = "<b>Synergy: {conf:.0%}</b><br/><hr/>"
+_TT_SMART_HDR = "<b>Smart Synergy:</b> {conf}<br/><hr/>"
+
+# SkillInfoPanel detail fragments
+_INFO_AFTERCAST = "<a href='aftercast' style='text-decoration: underline; color: {color};'>+ {aftercast}s</a>"
+_INFO_LINK = '<a href="{url}" style="color: {color};">{name}</a>'
+_ACQUISITION_SECTIONS = (
+    ("quests", "Quests"), ("trainers", "Trainers"),
+    ("hero_trainers", "Hero Trainers"), ("capture", "Capture"),
+)
+
+def _format_acquisition_links(text_blob, color):
+    """ Turns newline-separated "name|url" entries into links; other lines pass through. """
+    if not text_blob: return ""
+    links = []
+    for line in text_blob.split('\n'):
+        parts = line.split('|')
+        if len(parts) >= 2:
+            links.append(_INFO_LINK.format(url=parts[1], color=color, name=parts[0]))
+        else:
+            links.append(line)
+    return "<br/>".join(links)
+
+# Monster build analysis: one alternation scanned once, dispatched on the group name.
+# Notes are emitted in this order whatever order the keywords appear in.
+_MONSTER_ANALYSIS = (
+    ("hex", "hex", "- Uses Hexes. Suggest Hex Removal."),
+    ("cond", "condition|bleeding|poison|disease|burning|weakness", "- Uses Conditions. Suggest Condition Removal."),
+    ("kd", "knock down", "- Uses Knockdowns. Suggest Stability."),
+    ("interrupt", "interrupt", "- Uses Interrupts. Careful with long casts."),
+    ("stance", "stance", "- Uses Stances. Suggest Wild Blow or Wild Throw."),
+    ("ench", "enchantment", "- Uses Enchantments. Suggest Strip/Removal."),
+)
+_MONSTER_ANALYSIS_RE = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in _MONSTER_ANALYSIS))
+
+# Library items keep their tooltip inputs under this role; the HTML is built on hover.
+# () for a plain entry, (reason, confidence_pct) for a suggestion
+_TOOLTIP_ARGS_ROLE = Qt.ItemDataRole.UserRole.value + 1
+# Library items carry their icon filename; the delegate paints it from the pixmap cache at the current size
+ICON_FILE_ROLE = Qt.ItemDataRole.UserRole.value + 2
 
 class ClickableLabel(QLabel):
     clicked = pyqtSignal()
@@ -21,6 +323,8 @@ class DraggableSkillIcon(QLabel):
     def __init__(self, skill: Skill, parent=None, size=None):
         super().__init__(parent)
         self.skill = skill
+        self.drag_start_pos = None
+        self._has_pixmap = False # Set once an icon lands; the fallback text is themed otherwise
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         
@@ -29,40 +333,77 @@ class DraggableSkillIcon(QLabel):
         self.set_icon_size(current_size)
 
     def refresh_theme(self):
-        if not self.pixmap():
-            self.setStyleSheet(f"border: 1px solid {get_color('slot_border')}; background-color: {get_color('input_bg')}; color: {get_color('text_primary')};")
+        if not self._has_pixmap:
+            c = get_theme_snapshot()
+            self.setStyleSheet(f"border: 1px solid {c['slot_border']}; background-color: {c['input_bg']}; color: {c['text_primary']};")
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
+            # A plain click only selects; the drag starts once the cursor actually moves
+            self.drag_start_pos = event.position().toPoint()
             self.clicked.emit(self.skill)
+
+    def mouseMoveEvent(self, event):
+        if not (event.buttons() & Qt.MouseButton.LeftButton):
+            return
+        if not self.drag_start_pos:
+            return
+        
+        if (event.position().toPoint() - self.drag_start_pos).manhattanLength() < QApplication.startDragDistance():
+            return
+        self.drag_start_pos = None
+        
+        drag = QDrag(self)
+        mime_data = QMimeData()
+        mime_data.setText(str(self.skill.id))
+        drag.setMimeData(mime_data)
+        
+        pix = _get_icon_pixmap(self.skill.icon_filename, DRAG_CURSOR_SIZE)
+        if pix is not None:
+            drag.setPixmap(pix)
+            drag.setHotSpot(QPoint(DRAG_CURSOR_SIZE // 2, DRAG_CURSOR_SIZE // 2))
             
-            drag = QDrag(self)
-            mime_data = QMimeData()
-            mime_data.setText(str(self.skill.id))
-            drag.setMimeData(mime_data)
-            
-            if self.pixmap():
-                drag.setPixmap(self.pixmap())
-                drag.setHotSpot(QPoint(self.width() // 2, self.height() // 2))
-                
-            drag.exec(Qt.DropAction.CopyAction)
+        drag.exec(Qt.DropAction.CopyAction)
+
+    def mouseReleaseEvent(self, event):
+        self.drag_start_pos = None
+        super().mouseReleaseEvent(event)
 
     def set_icon_size(self, size):
         self.setFixedSize(size, size)
-        
-        # Use size-aware caching
-        cache_key = f"{self.skill.icon_filename}_{size}"
-        if cache_key in PIXMAP_CACHE:
-            self.setPixmap(PIXMAP_CACHE[cache_key])
+        self._icon_request = size
+        self._icon_pending = True
+        load_icon_async(self.skill.icon_filename, size, lambda pix: self._apply_icon(size, pix))
+
+    def _apply_icon(self, size, pix):
+        if size != self._icon_request:
+            return # Resized again while this one decoded
+        self._icon_pending = False
+        self._has_pixmap = pix is not None
+        if pix is not None:
+            self.setPixmap(pix)
         else:
-            path = os.path.join(ICON_DIR, self.skill.icon_filename)
-            if os.path.exists(path):
-                pix = QPixmap(path).scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                PIXMAP_CACHE[cache_key] = pix
-                self.setPixmap(pix)
-            else:
-                self.setText(self.skill.name[:2])
-                self.refresh_theme()
+            self.setText(self.skill.name[:2])
+            self.refresh_theme()
+
+def slot_qss():
+    """
+    Application stylesheet rules for skill slots. Slots flip their slotstate/dragover
+    dynamic properties instead of calling setStyleSheet per change. The icon label is
+    styled alongside its slot.
+    """
+    c = get_theme_snapshot()
+    return f"""
+        SkillSlot[slotstate="equipped"], SkillSlot[slotstate="equipped"] QLabel {{
+            border: 2px solid {c['border_light']}; background-color: {c['slot_bg_equipped']};
+        }}
+        SkillSlot[slotstate="empty"], SkillSlot[slotstate="empty"] QLabel {{
+            border: 2px dashed {c['slot_border']}; background-color: {c['slot_bg']};
+        }}
+        SkillSlot[dragover="true"], SkillSlot[dragover="true"] QLabel {{
+            border: 2px solid {c['border_accent']}; background-color: {c['slot_bg_drag']};
+        }}
+    """
 
 class SkillSlot(QFrame):
     skill_equipped = pyqtSignal(int, int) 
@@ -76,34 +417,137 @@ class SkillSlot(QFrame):
         self.current_skill_id = None
         self.is_ghost = False
         self.drag_start_pos = None
+        self._tooltip_data = None
+        self._icon_request = None
+        self.setAcceptDrops(True)
+        # Styled by slot_qss() in the app stylesheet
+        self.setProperty("slotstate", "empty")
+        self.setProperty("dragover", False)
         
         self.setFixedSize(ICON_SIZE + 4, ICON_SIZE + 4)
-        self.setAcceptDrops(True)
-        self.refresh_theme()
         
         self.icon_label = QLabel(self)
         self.icon_label.setGeometry(2, 2, ICON_SIZE, ICON_SIZE)
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.icon_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents) 
 
-    def refresh_theme(self):
+    def set_skill(self, skill_id, skill_obj: Skill = None, ghost=False, confidence=0.0, rank=0, bonuses: dict = None, global_act=0.0, global_rech=0.0):
+        self.current_skill_id = skill_id
+        self.is_ghost = ghost
+        
+        icon_file = skill_obj.icon_filename if skill_obj else f"{skill_id}.jpg"
+
+        # Decoded off the GUI thread on a cache miss, so loading a whole bar doesn't block painting
+        self._icon_request = request = (icon_file, ghost, skill_obj.name if skill_obj else str(skill_id))
+        if not load_icon_async(icon_file, ICON_SIZE, lambda pix: self._apply_icon(request, pix)):
+            self.icon_label.clear()
+
+        # Tooltip HTML is only built when Qt actually asks for it (see event)
+        self._tooltip_data = (skill_id, skill_obj, ghost, confidence, rank, bonuses, global_act, global_rech)
+
         self.update_style()
 
+    def _apply_icon(self, request, pix):
+        if request is not self._icon_request:
+            return # The slot changed while this icon decoded
+        icon_file, ghost, fallback_text = request
+        if pix is None:
+            pix = _get_fallback_pixmap(fallback_text, ghost)
+        elif ghost:
+            pix = _get_icon_pixmap(icon_file, ICON_SIZE, ghost=True) # Opaque copy is cached now
+        self.icon_label.setPixmap(pix)
+
+    def refresh_icon(self):
+        """ Re-fetches the shown icon from the cache, e.g. once fast in-flight scales are dropped. """
+        request = self._icon_request
+        if request is not None:
+            load_icon_async(request[0], ICON_SIZE, lambda pix: self._apply_icon(request, pix))
+
+    def event(self, event):
+        if event.type() == QEvent.Type.ToolTip and self._tooltip_data:
+            QToolTip.showText(event.globalPos(), self._build_tooltip(), self)
+            return True
+        return super().event(event)
+
+    def _build_tooltip(self):
+        skill_id, skill_obj, ghost, confidence, rank, bonuses, global_act, global_rech = self._tooltip_data
+        if skill_obj:
+            fields = {
+                "name": skill_obj.name,
+                "attr": "",
+                "type": "",
+                "energy": "",
+                "recharge": "",
+                "desc": skill_obj.get_description_for_rank(rank, bonuses),
+            }
+            if skill_obj.attribute != -1:
+                fields["attr"] = _TT_ATTR.format(attr=ATTR_MAP.get(skill_obj.attribute, "None"), rank=rank)
+            
+            if skill_obj.skill_type:
+                fields["type"] = _TT_TYPE.format(type=skill_obj.skill_type.title())
+            
+            eff_energy, eff_act, eff_rech = skill_obj.get_effective_stats(rank, bonuses, global_act, global_rech)
+
+            # Energy Cost in Tooltip
+            if skill_obj.energy > 0:
+                tpl = _TT_STAT_REDUCED if eff_energy < skill_obj.energy else _TT_STAT
+                fields["energy"] = tpl.format(label="Energy", eff=eff_energy, base=skill_obj.energy, unit="")
+
+            # Cast & Recharge in Tooltip
+            tpl = _TT_STAT_REDUCED if eff_act < skill_obj.activation else _TT_STAT
+            fields["activation"] = tpl.format(label="Activation", eff=eff_act, base=skill_obj.activation, unit="s")
+
+            if skill_obj.recharge > 0:
+                tpl = _TT_STAT_REDUCED if eff_rech < skill_obj.recharge else _TT_STAT
+                fields["recharge"] = tpl.format(label="Recharge", eff=eff_rech, base=skill_obj.recharge, unit="s")
+
+            tooltip = _TT_FULL.format_map(fields)
+            
+            if ghost:
+                hdr = _TT_SMART_HDR if isinstance(confidence, str) else _TT_GHOST_HDR
+                tooltip = hdr.format(conf=confidence) + tooltip
+            
+            return tooltip
+        return str(skill_id)
+
+    def clear_slot(self, silent=False):
+        self.current_skill_id = None
+        self.is_ghost = False
+        self.icon_label.clear()
+        self._tooltip_data = None
+        self._icon_request = None
+        self.update_style()
+        if not silent:
+            self.skill_removed.emit(self.index)
+
+    def update_style(self):
+        self._set_style_property("slotstate", "equipped" if self.current_skill_id and not self.is_ghost else "empty")
+
+    def _set_style_property(self, name, value):
+        # A property flip only re-polishes; the app stylesheet is never re-parsed
+        if self.property(name) == value:
+            return
+        self.setProperty(name, value)
+        style = self.style()
+        for widget in (self, self.icon_label):
+            style.unpolish(widget)
+            style.polish(widget)
+
     def dragEnterEvent(self, event):
         if event.mimeData().hasText():
             event.accept()
-            self.setStyleSheet(f"border: 2px solid {get_color('border_accent')}; background-color: {get_color('slot_bg_drag')};")
+            self._set_style_property("dragover", True)
         else:
             event.ignore()
 
     def dragLeaveEvent(self, event):
-        self.update_style()
+        self._set_style_property("dragover", False)
 
     def dropEvent(self, event):
         try:
             mime_text = event.mimeData().text()
             if mime_text.startswith("slot:"):
-                source_index = int(mime_text.split(":")[1])
+                source_index = int(mime_text.partition(":")[2])
                 if source_index != self.index:
                     self.skill_swapped.emit(source_index, self.index)
                 event.accept()
@@ -117,6 +561,7 @@ class SkillSlot(QFrame):
         except ValueError:
             event.ignore()
         finally:
+            self._set_style_property("dragover", False)
             self.update_style()
 
     def mousePressEvent(self, event):
@@ -146,10 +591,13 @@ class SkillSlot(QFrame):
         mime_data.setText(f"slot:{self.index}")
         drag.setMimeData(mime_data)
         
-        pix = self.icon_label.pixmap()
+        skill_obj = self._tooltip_data[1] if self._tooltip_data else None
+        pix = _get_icon_pixmap(skill_obj.icon_filename, DRAG_CURSOR_SIZE) if skill_obj else None
+        if pix is None:
+            pix = self.icon_label.pixmap() # Missing-icon placeholder
         if pix and not pix.isNull():
             drag.setPixmap(pix)
-            drag.setHotSpot(QPoint(ICON_SIZE // 2, ICON_SIZE // 2))
+            drag.setHotSpot(QPoint(DRAG_CURSOR_SIZE // 2, DRAG_CURSOR_SIZE // 2))
         
         # Execute Drag
         result = drag.exec(Qt.DropAction.MoveAction)
@@ -166,109 +614,25 @@ class SkillSlot(QFrame):
             else:
                 self.clear_slot()
 
-    def set_skill(self, skill_id, skill_obj: Skill = None, ghost=False, confidence=0.0, rank=0, bonuses: dict = None, global_act=0.0, global_rech=0.0):
-        self.current_skill_id = skill_id
-        self.is_ghost = ghost
-        
-        icon_file = skill_obj.icon_filename if skill_obj else f"{skill_id}.jpg"
-        if not icon_file.lower().endswith('.jpg'):
-            icon_file += '.jpg'
-            
-        path = os.path.join(ICON_DIR, icon_file)
-        
-        pix = QPixmap()
-        if os.path.exists(path):
-            pix.load(path)
-        else:
-            pix = QPixmap(ICON_SIZE, ICON_SIZE)
-            pix.fill(QColor(get_color("bg_hover")))
-            p = QPainter(pix)
-            p.setPen(QColor(get_color("text_primary")))
-            p.drawText(pix.rect(), Qt.AlignmentFlag.AlignCenter, skill_obj.name if skill_obj else str(skill_id))
-            p.end()
-
-        if ghost:
-            transparent_pix = QPixmap(pix.size())
-            transparent_pix.fill(Qt.GlobalColor.transparent)
-            p = QPainter(transparent_pix)
-            p.setOpacity(0.4)
-            p.drawPixmap(0, 0, pix)
-            p.end()
-            self.icon_label.setPixmap(transparent_pix)
-        else:
-            self.icon_label.setPixmap(pix)
-
-        # Build detailed tooltip
-        if skill_obj:
-            desc = skill_obj.get_description_for_rank(rank, bonuses)
-            attr_name = ATTR_MAP.get(skill_obj.attribute, "None")
-            tooltip = f"<b>{skill_obj.name}</b><br/>"
-            if skill_obj.attribute != -1:
-                tooltip += f"<i>{attr_name} ({rank})</i><br/>"
-            
-            if skill_obj.skill_type:
-                tooltip += f"<i>{skill_obj.skill_type.title()}</i><br/>"
-            
-            # Energy Cost in Tooltip
-            eff_energy = skill_obj.get_effective_energy(rank, bonuses)
-            if skill_obj.energy > 0:
-                if eff_energy < skill_obj.energy:
-                    tooltip += f"Energy: <span style='color:#00FF00;'>{eff_energy}</span> (Base: {skill_obj.energy})<br/>"
-                else:
-                    tooltip += f"Energy: {skill_obj.energy}<br/>"
-
-            # Cast & Recharge in Tooltip
-            eff_act = skill_obj.get_effective_activation(rank, bonuses, global_act)
-            if eff_act < skill_obj.activation:
-                tooltip += f"Activation: <span style='color:#00FF00;'>{eff_act}s</span> (Base: {skill_obj.activation}s)<br/>"
-            else:
-                tooltip += f"Activation: {skill_obj.activation}s<br/>"
-
-            eff_rech = skill_obj.get_effective_recharge(rank, bonuses, global_rech)
-            if skill_obj.recharge > 0:
-                if eff_rech < skill_obj.recharge:
-                    tooltip += f"Recharge: <span style='color:#00FF00;'>{eff_rech}s</span> (Base: {skill_obj.recharge}s)<br/>"
-                else:
-                    tooltip += f"Recharge: {skill_obj.recharge}s<br/>"
-
-            tooltip += f"<br/>{desc}"
-            
-            if ghost:
-                if isinstance(confidence, str):
-                    tooltip = f"<b>Smart Synergy:</b> {confidence}<br/><hr/>" + tooltip
-                else:
-                    tooltip = f"<b>Synergy: {confidence:.0%}</b><br/><hr/>" + tooltip
-            
-            self.setToolTip(tooltip)
-        else:
-            self.setToolTip(str(skill_id))
-
-        self.update_style()
-
-    def clear_slot(self, silent=False):
-        self.current_skill_id = None
-        self.is_ghost = False
-        self.icon_label.clear()
-        self.setToolTip("")
-        if not silent:
-            self.skill_removed.emit(self.index)
-        self.update_style()
-
-    def update_style(self):
-        if self.current_skill_id and not self.is_ghost:
-            self.setStyleSheet(f"border: 2px solid {get_color('border_light')}; background-color: {get_color('slot_bg_equipped')};")
-        else:
-            self.setStyleSheet(f"border: 2px dashed {get_color('slot_border')}; background-color: {get_color('slot_bg')};")
-
 class SkillInfoPanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumWidth(100)
+        self._analysis_cache = {} # {tuple(skill names): analysis lines}
+        self._icon_file = None # Icon shown in lbl_icon, so refresh_icon can fetch it again
+        self._built = False # Scroll area content is built on first show/update
+        self._theme_gen_applied = -1 # refresh_theme is a no-op until theme.THEME_GEN moves on
         self.refresh_theme()
+        THEME_SIGNALS.theme_changed.connect(self.refresh_theme)
         
         # Main Layout for the QFrame itself
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
+        self._main_layout = QVBoxLayout(self)
+        self._main_layout.setContentsMargins(0, 0, 0, 0)
+
+    def _build_ui(self):
+        if self._built:
+            return
+        self._built = True
         
         # Scroll Area Setup
         self.scroll_area = QScrollArea()
@@ -310,7 +674,11 @@ class SkillInfoPanel(QFrame):
         
         # Finalize Scroll Area
         self.scroll_area.setWidget(self.content_widget)
-        main_layout.addWidget(self.scroll_area)
+        self._main_layout.addWidget(self.scroll_area)
+
+    def showEvent(self, event):
+        self._build_ui()
+        super().showEvent(event)
 
     def on_link_hovered(self, link):
         if link == "aftercast":
@@ -324,25 +692,40 @@ class SkillInfoPanel(QFrame):
         QDesktopServices.openUrl(QUrl(link))
 
     def refresh_theme(self):
-        self.setStyleSheet(f"background-color: {get_color('bg_tertiary')}; border-left: 1px solid {get_color('border')};")
-        # Check if initialized fully
-        if hasattr(self, 'lbl_name'):
+        if self._theme_gen_applied == theme.THEME_GEN: return
+        self._theme_gen_applied = theme.THEME_GEN
+        c = get_theme_snapshot()
+        self.setStyleSheet(f"background-color: {c['bg_tertiary']}; border-left: 1px solid {c['border']};")
+        # Labels pick up the current theme when they are built
+        if self._built:
             self.refresh_labels()
 
     def refresh_labels(self):
-        self.lbl_name.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {get_color('text_accent')};")
-        self.lbl_icon.setStyleSheet(f"border: 1px solid {get_color('border')};")
-        self.txt_desc.setStyleSheet(f"color: {get_color('text_secondary')}; font-style: italic;")
-        self.details.setStyleSheet(f"color: {get_color('text_tertiary')};")
+        c = get_theme_snapshot()
+        self._qss = {
+            "name": f"font-size: 16px; font-weight: bold; color: {c['text_accent']};",
+            "name_boss": f"font-size: 16px; font-weight: bold; color: {c['text_warning']};",
+            "icon": f"border: 1px solid {c['border']};",
+            "desc": f"color: {c['text_secondary']}; font-style: italic;",
+            "details": f"color: {c['text_tertiary']};",
+        }
+        self.lbl_name.setStyleSheet(self._qss["name"])
+        self.lbl_icon.setStyleSheet(self._qss["icon"])
+        self.txt_desc.setStyleSheet(self._qss["desc"])
+        self.details.setStyleSheet(self._qss["details"])
 
     def update_info(self, skill: Skill, repo=None, rank=0, bonuses: dict = None, global_act=0.0, global_rech=0.0):
+        self._build_ui()
+        c = get_theme_snapshot()
         self.lbl_name.setText(skill.name)
         
-        path = os.path.join(ICON_DIR, skill.icon_filename)
-        if os.path.exists(path):
-            self.lbl_icon.setPixmap(QPixmap(path).scaled(128, 128, Qt.AspectRatioMode.KeepAspectRatio))
+        pix = _get_icon_pixmap(skill.icon_filename, 128)
+        if pix is not None:
+            self.lbl_icon.setPixmap(pix)
+            self._icon_file = skill.icon_filename
         else:
             self.lbl_icon.clear()
+            self._icon_file = None
             
         self.txt_desc.setText(skill.get_description_for_rank(rank, bonuses))
         
@@ -357,8 +740,9 @@ class SkillInfoPanel(QFrame):
         if skill.skill_type:
             info.append(f"Type: {skill.skill_type.title()}")
         
+        eff_energy, eff_act, eff_rech = skill.get_effective_stats(rank, bonuses, global_act, global_rech)
+
         # Energy Calculation
-        eff_energy = skill.get_effective_energy(rank, bonuses)
         if skill.energy > 0:
             if eff_energy < skill.energy:
                 info.append(f"Energy: <span style='color:#00FF00;'><b>{eff_energy}</b></span> (Base: {skill.energy})")
@@ -369,17 +753,15 @@ class SkillInfoPanel(QFrame):
         if skill.adrenaline: info.append(f"Adrenaline: {skill.adrenaline}")
         
         # Combined Timing Display
-        eff_act = skill.get_effective_activation(rank, bonuses, global_act)
         total_time = round(eff_act + skill.aftercast, 2)
         
         act_str = f"{eff_act}s"
         if eff_act < skill.activation:
             act_str = f"<span style='color:#00FF00;'><b>{eff_act}s</b></span> (Base: {skill.activation}s)"
         
-        aftercast_link = f"<a href='aftercast' style='text-decoration: underline; color: {get_color('text_tertiary')};'>+ {skill.aftercast}s</a>"
+        aftercast_link = _INFO_AFTERCAST.format(color=c["text_tertiary"], aftercast=skill.aftercast)
         info.append(f"Cast: {act_str} {aftercast_link} ({total_time}s)") 
         
-        eff_rech = skill.get_effective_recharge(rank, bonuses, global_rech)
         if skill.recharge: 
             if eff_rech < skill.recharge:
                 info.append(f"Recharge: <span style='color:#00FF00;'><b>{eff_rech}s</b></span> (Base: {skill.recharge}s)")
@@ -394,69 +776,82 @@ class SkillInfoPanel(QFrame):
         if repo:
             aq = repo.get_skill_acquisition(skill.id)
             if aq:
-                # Helper to format links
-                def format_links(text_blob):
-                    if not text_blob: return ""
-                    links = []
-                    # Split by newlines first
-                    for line in text_blob.split('\n'):
-                        parts = line.split('|')
-                        if len(parts) >= 2:
-                            name, url = parts[0], parts[1]
-                            links.append(f'<a href="{url}" style="color: {get_color("text_accent")};">{name}</a>')
-                        else:
-                            links.append(line)
-                    return "<br/>".join(links)
-
                 if aq.get('campaign'):
                     info.append(f"<b>Campaign:</b> {aq['campaign']}")
                 
-                if aq.get('quests'):
-                    links = format_links(aq['quests'])
-                    if links: info.append(f"<b>Quests:</b><br/>{links}")
-                    
-                if aq.get('trainers'):
-                    links = format_links(aq['trainers'])
-                    if links: info.append(f"<b>Trainers:</b><br/>{links}")
-                
-                if aq.get('hero_trainers'):
-                    links = format_links(aq['hero_trainers'])
-                    if links: info.append(f"<b>Hero Trainers:</b><br/>{links}")
-                    
-                if aq.get('capture'):
-                    links = format_links(aq['capture'])
-                    if links: info.append(f"<b>Capture:</b><br/>{links}")
+                accent = c["text_accent"]
+                for key, label in _ACQUISITION_SECTIONS:
+                    if aq.get(key):
+                        links = _format_acquisition_links(aq[key], accent)
+                        if links: info.append(f"<b>{label}:</b><br/>{links}")
         
         self.details.setWordWrap(True)
         self.details.setText("<br/><br/>".join(info))
         self.details.setOpenExternalLinks(False)
 
+    def refresh_icon(self):
+        """ Re-fetches the shown icon from the cache, e.g. once fast in-flight scales are dropped. """
+        if self._icon_file is not None:
+            pix = _get_icon_pixmap(self._icon_file, 128)
+            if pix is not None:
+                self.lbl_icon.setPixmap(pix)
+
     def update_monster_info(self, monster_data):
+        self._build_ui()
         self.lbl_name.setText(monster_data['name'])
-        if monster_data.get('is_boss'):
-            self.lbl_name.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {get_color('text_warning')};")
-        else:
-            self.lbl_name.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {get_color('text_accent')};")
+        self.lbl_name.setStyleSheet(self._qss["name_boss" if monster_data.get('is_boss') else "name"])
             
         self.lbl_icon.clear()
+        self._icon_file = None
         
         skills = monster_data.get('skills', [])
         self.txt_desc.setText("<b>Build:</b><br/>" + (", ".join(skills) if skills else "No known skills."))
         
-        analysis = []
-        if skills:
-            analysis.append("<b>Analysis:</b>")
-            text = " ".join(skills).lower()
-            if "hex" in text: analysis.append("- Uses Hexes. Suggest Hex Removal.")
-            if any(x in text for x in ["condition", "bleeding", "poison", "disease", "burning", "weakness"]): 
-                analysis.append("- Uses Conditions. Suggest Condition Removal.")
-            if "knock down" in text: analysis.append("- Uses Knockdowns. Suggest Stability.")
-            if "interrupt" in text: analysis.append("- Uses Interrupts. Careful with long casts.")
-            if "stance" in text: analysis.append("- Uses Stances. Suggest Wild Blow or Wild Throw.")
-            if "enchantment" in text: analysis.append("- Uses Enchantments. Suggest Strip/Removal.")
+        # Same skill list -> same analysis, so only scan the text once per build
+        key = tuple(skills)
+        analysis = self._analysis_cache.get(key)
+        if analysis is None:
+            analysis = []
+            if skills:
+                analysis.append("<b>Analysis:</b>")
+                text = " ".join(skills).lower()
+                found = {m.lastgroup for m in _MONSTER_ANALYSIS_RE.finditer(text)}
+                analysis.extend(note for name, _, note in _MONSTER_ANALYSIS if name in found)
+            self._analysis_cache[key] = analysis
             
         self.details.setText("<br/>".join(analysis))
 
+# Build categories whose previews offer Populate/Edit/Import
+_USER_CATS = frozenset(("User Created", "User Imported"))
+
+def preview_button_qss():
+    """
+    Application stylesheet rules for the BuildPreviewWidget buttons. Buttons carry
+    role/state dynamic properties, so a theme change is one app-level parse instead of
+    a setStyleSheet per button.
+    """
+    c = get_theme_snapshot()
+    return f"""
+        QPushButton[role="preview"] {{
+            background-color: {c['border_accent']}; 
+            color: #FFFFFF; 
+            border: none; 
+            border-radius: 4px;
+            font-weight: bold;
+            font-size: 9px;
+        }}
+        QPushButton[role="preview"]:hover {{
+            background-color: {c['text_link']};
+        }}
+        QPushButton[role="preview"][state="editing"] {{
+            background-color: {c['text_warning']}; 
+            color: #000000; 
+        }}
+        QPushButton[role="preview"][state="editing"]:hover {{
+            background-color: #FFAA00;
+        }}
+    """
+
 class BuildPreviewWidget(QFrame):
     load_clicked = pyqtSignal(Build) 
     skill_clicked = pyqtSignal(Skill) 
@@ -468,9 +863,16 @@ class BuildPreviewWidget(QFrame):
     def __init__(self, build: Build, repo, is_pvp=False, parent=None, icon_size=64):
         super().__init__(parent)
         self.build = build
+        self._is_user_editable = getattr(build, 'is_user_build', False) or build.category in _USER_CATS
+        self._has_wiki = bool(getattr(build, 'url', ''))
         self.repo = repo
+        self.is_pvp = is_pvp
         self.icon_size = icon_size
         self.is_editing = False
+        self._skill_icons = []
+        self._placeholders = []
+        self._built = False # Skill icons and buttons are built once the row is first on screen
+        self._drag_thumb = (None, None) # (key, pixmap) of the last drag thumbnail, see drag_thumbnail
         
         # Dynamic height based on icon size
         self.setFixedHeight(icon_size + 150) 
@@ -509,10 +911,8 @@ class BuildPreviewWidget(QFrame):
         skills_inner.setSpacing(10)
         skills_inner.setContentsMargins(0, 0, 0, 0)
         
-        p1_name = PROF_MAP.get(int(build.primary_prof) if build.primary_prof.isdigit() else 0, "No Profession")
-        p2_name = PROF_MAP.get(int(build.secondary_prof) if build.secondary_prof.isdigit() else 0, "No Profession")
-        p1 = PROF_SHORT_MAP.get(p1_name, "X")
-        p2 = PROF_SHORT_MAP.get(p2_name, "X")
+        p1 = PROF_CODE_TO_SHORT.get(build.primary_prof, "X")
+        p2 = PROF_CODE_TO_SHORT.get(build.secondary_prof, "X")
         
         lbl_prof = QLabel(f"{p1}/{p2}", self) # Parented
         lbl_prof.setStyleSheet(f"color: {get_color('text_tertiary')}; font-weight: bold; font-size: 14px; border: none; background: transparent;")
@@ -520,14 +920,39 @@ class BuildPreviewWidget(QFrame):
         lbl_prof.setAlignment(Qt.AlignmentFlag.AlignCenter)
         skills_inner.addWidget(lbl_prof)
         
+        skills_wrapper.addLayout(skills_inner)
+        self.content_layout.addLayout(skills_wrapper)
+        self.content_layout.addStretch() 
+        self._skills_inner = skills_inner
+        
+        main_layout.addLayout(self.content_layout, 1)
+        self._theme_gen_applied = -1
+        self.refresh_theme()
+        THEME_SIGNALS.theme_changed.connect(self.refresh_theme)
+
+    def ensure_built(self):
+        """
+        Builds the skill icons and buttons. Runs once, when the row is first painted or
+        scrolled into view, so long build lists only pay for the rows actually seen.
+        """
+        if self._built:
+            return
+        self._built = True
+        
+        build = self.build
+        icon_size = self.icon_size
+        skills_inner = self._skills_inner
+        
+        skills = self.repo.get_skills([sid for sid in build.skill_ids if sid], is_pvp=self.is_pvp)
         for sid in build.skill_ids:
             skill_widget = None
             if sid != 0:
-                skill = repo.get_skill(sid, is_pvp=is_pvp)
+                skill = skills.get(sid)
                 if skill:
                     skill_widget = DraggableSkillIcon(skill, parent=self, size=icon_size) # Parented
                     skill_widget.setStyleSheet("background: transparent; border: none;")
                     skill_widget.clicked.connect(self.skill_clicked.emit)
+                    self._skill_icons.append(skill_widget)
             
             if skill_widget:
                 skills_inner.addWidget(skill_widget)
@@ -536,74 +961,50 @@ class BuildPreviewWidget(QFrame):
                 placeholder.setFixedSize(icon_size, icon_size)
                 placeholder.setStyleSheet(f"background: transparent; border: 1px dashed {get_color('border')};")
                 skills_inner.addWidget(placeholder)
-        
-        skills_wrapper.addLayout(skills_inner)
-        self.content_layout.addLayout(skills_wrapper)
-        self.content_layout.addStretch() 
+                self._placeholders.append(placeholder)
         
         # --- RIGHT SIDE: Buttons (Stays at top) ---
         btn_vbox = QVBoxLayout()
         btn_vbox.setSpacing(4)
         btn_vbox.setContentsMargins(0, 0, 0, 0)
         
-        self.btn_populate = QPushButton("Populate", self) # Parented
-        self.btn_populate.setFixedSize(60, 18)
-        self.btn_populate.setStyleSheet("font-size: 9px;")
-        self.btn_populate.setToolTip("Overwrite this slot with the current bar skills and attributes")
-        self.btn_populate.clicked.connect(lambda: self.populate_clicked.emit(self.build))
-        # Only show for user builds
-        is_user = getattr(build, 'is_user_build', False)
-        is_user_cat = build.category in ["User Created", "User Imported"]
-        self.btn_populate.setVisible(is_user or is_user_cat)
-
-        self.btn_edit = QPushButton("Edit", self) # Parented
-        self.btn_edit.setFixedSize(60, 18)
-        self.btn_edit.setStyleSheet("font-size: 9px;")
-        self.btn_edit.setToolTip("Load to bar and Edit")
-        self.btn_edit.clicked.connect(self.toggle_edit_state)
-        
-        # Only show Edit button for User Created or User Imported builds
-        is_user = getattr(build, 'is_user_build', False)
-        is_user_cat = build.category in ["User Created", "User Imported"]
-        self.btn_edit.setVisible(is_user or is_user_cat)
-
-        self.btn_import = QPushButton("Import", self) # Parented
-        self.btn_import.setFixedSize(60, 18)
-        self.btn_import.setStyleSheet("font-size: 9px;")
-        self.btn_import.setToolTip("Import a build code from file into this slot")
-        self.btn_import.clicked.connect(lambda: self.import_clicked.emit(self.build))
-        # Only show Import for user builds too
-        self.btn_import.setVisible(is_user or is_user_cat)
-
-        self.btn_load = QPushButton("Load", self) # Parented
-        self.btn_load.setFixedSize(60, 18)
-        self.btn_load.setStyleSheet("font-size: 9px;")
-        self.btn_load.clicked.connect(lambda: self.load_clicked.emit(self.build))
+        # (attribute, text, tooltip, slot, visible) - populate/edit/import only for user builds,
+        # wiki only if a URL exists. Styling comes from preview_button_qss() via the role property.
+        button_specs = (
+            ("btn_populate", "Populate", "Overwrite this slot with the current bar skills and attributes",
+             lambda: self.populate_clicked.emit(self.build), self._is_user_editable),
+            ("btn_edit", "Edit", "Load to bar and Edit", self.toggle_edit_state, self._is_user_editable),
+            ("btn_import", "Import", "Import a build code from file into this slot",
+             lambda: self.import_clicked.emit(self.build), self._is_user_editable),
+            ("btn_load", "Load", None, lambda: self.load_clicked.emit(self.build), True),
+            ("btn_rename", "Rename", None, lambda: self.rename_clicked.emit(self.build), True),
+            ("btn_wiki", "Wiki Page", None, self.open_wiki, self._has_wiki),
+        )
+        for attr, text, tooltip, slot, visible in button_specs:
+            btn = QPushButton(text, self) # Parented
+            btn.setObjectName(attr)
+            btn.setFixedSize(60, 18)
+            btn.setProperty("role", "preview")
+            btn.setProperty("state", "normal")
+            if tooltip:
+                btn.setToolTip(tooltip)
+            btn.clicked.connect(slot)
+            if not visible:
+                btn.setVisible(False)
+            btn_vbox.addWidget(btn)
+            setattr(self, attr, btn)
         
-        self.btn_rename = QPushButton("Rename", self) # Parented
-        self.btn_rename.setFixedSize(60, 18)
-        self.btn_rename.setStyleSheet("font-size: 9px;")
-        self.btn_rename.clicked.connect(lambda: self.rename_clicked.emit(self.build))
-        
-        self.btn_wiki = QPushButton("Wiki Page", self) # Parented
-        self.btn_wiki.setFixedSize(60, 18)
-        self.btn_wiki.setStyleSheet("font-size: 9px;")
-        self.btn_wiki.clicked.connect(self.open_wiki)
-        # Only show if URL exists
-        self.btn_wiki.setVisible(bool(getattr(self.build, 'url', '')))
-        
-        btn_vbox.addWidget(self.btn_populate)
-        btn_vbox.addWidget(self.btn_edit)
-        btn_vbox.addWidget(self.btn_import)
-        btn_vbox.addWidget(self.btn_load)
-        btn_vbox.addWidget(self.btn_rename)
-        btn_vbox.addWidget(self.btn_wiki)
-        
-        self.refresh_button_style()
         self.content_layout.addLayout(btn_vbox)
         
-        main_layout.addLayout(self.content_layout, 1)
-        self.refresh_theme()
+        if self.is_editing:
+            self.btn_edit.setText("Save")
+            self.btn_edit.setProperty("state", "editing")
+
+    def paintEvent(self, event):
+        if not self._built:
+            # Build on the next pass of the event loop rather than mid-paint
+            QTimer.singleShot(0, self.ensure_built)
+        super().paintEvent(event)
 
     def toggle_edit_state(self):
         if self.is_editing:
@@ -614,43 +1015,27 @@ class BuildPreviewWidget(QFrame):
             # Was Normal, now Editing
             self.is_editing = True
             self.btn_edit.setText("Save")
-            self.btn_edit.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {get_color('text_warning')}; 
-                    color: #000000; 
-                    border: none; 
-                    border-radius: 4px;
-                    font-weight: bold;
-                    font-size: 9px;
-                }}
-                QPushButton:hover {{
-                    background-color: #FFAA00;
-                }}
-            """)
+            self._set_edit_button_state("editing")
             self.edit_clicked.emit(self.build)
 
     def set_edit_mode(self, active=True):
         if self.is_editing == active: return
         self.is_editing = active
+        if not self._built: return # ensure_built applies the edit styling
         
         if self.is_editing:
             self.btn_edit.setText("Save")
-            self.btn_edit.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {get_color('text_warning')}; 
-                    color: #000000; 
-                    border: none; 
-                    border-radius: 4px;
-                    font-weight: bold;
-                    font-size: 9px;
-                }}
-                QPushButton:hover {{
-                    background-color: #FFAA00;
-                }}
-            """)
+            self._set_edit_button_state("editing")
         else:
             self.btn_edit.setText("Edit")
-            self.refresh_button_style()
+            self._set_edit_button_state("normal")
+
+    def _set_edit_button_state(self, state):
+        # Flip the dynamic property and re-polish; the rules live in the app stylesheet
+        self.btn_edit.setProperty("state", state)
+        style = self.btn_edit.style()
+        style.unpolish(self.btn_edit)
+        style.polish(self.btn_edit)
 
     def reset_edit_state(self):
         self.set_edit_mode(False)
@@ -661,59 +1046,60 @@ class BuildPreviewWidget(QFrame):
             QDesktopServices.openUrl(QUrl(url))
 
     def set_icon_size(self, size):
+        if size == self.icon_size: return
+        self.icon_size = size
         self.setFixedHeight(size + 140) # Dynamic height based on icon size
         
-        # Update placeholder and skill icon sizes
-        for i in range(self.content_layout.count()):
-            item = self.content_layout.itemAt(i)
-            if not item: continue
-            widget = item.widget()
-            if not widget: continue
-            
-            if isinstance(widget, DraggableSkillIcon):
-                widget.set_icon_size(size)
-            elif isinstance(widget, QFrame): # Placeholder
-                widget.setFixedSize(size, size)
+        # Resize in place from the pixmap cache; unbuilt rows pick the size up in ensure_built
+        for icon in self._skill_icons:
+            icon.set_icon_size(size)
+        for placeholder in self._placeholders:
+            placeholder.setFixedSize(size, size)
+
+    def refresh_icons(self):
+        # Re-fetch pixmaps at the current size, e.g. once fast in-flight scales are dropped
+        self._drag_thumb = (None, None)
+        for icon in self._skill_icons:
+            icon.set_icon_size(self.icon_size)
+
+    def drag_thumbnail(self):
+        """
+        Returns the semi-transparent thumbnail shown while this build is dragged.
+        It is reused until the build, the widget's size, theme, edit state or icon size changes.
+        """
+        b = self.build
+        key = (b.code, b.name, tuple(b.skill_ids), self.width(), self.height(), theme.THEME_GEN, self.is_editing, self.icon_size)
+        if self._drag_thumb[0] == key:
+            return self._drag_thumb[1]
+
+        pixmap = self.grab()
+        transparent_pix = QPixmap(pixmap.size())
+        transparent_pix.fill(Qt.GlobalColor.transparent)
+        p = QPainter(transparent_pix)
+        p.setOpacity(0.6)
+        p.drawPixmap(0, 0, pixmap)
+        p.end()
+        thumb = transparent_pix.scaled(400, self.height(), Qt.AspectRatioMode.KeepAspectRatio)
+
+        # Icons still decoding would be missing from the grab, so only keep a complete one
+        if not any(icon._icon_pending for icon in self._skill_icons):
+            self._drag_thumb = (key, thumb)
+        return thumb
 
     def refresh_theme(self):
+        # Button colours come from preview_button_qss() in the app stylesheet
+        if self._theme_gen_applied == theme.THEME_GEN: return
+        self._theme_gen_applied = theme.THEME_GEN
+        c = get_theme_snapshot()
         self.setStyleSheet(f"""
             BuildPreviewWidget {{
-                background-color: {get_color('bg_secondary')};
-                border: 1px solid {get_color('border')};
+                background-color: {c['bg_secondary']};
+                border: 1px solid {c['border']};
                 border-radius: 8px;
             }}
         """)
-        if hasattr(self, 'btn_load'):
-            self.refresh_button_style()
-
-    def refresh_button_style(self):
-        style = f"""
-            QPushButton {{
-                background-color: {get_color('border_accent')}; 
-                color: #FFFFFF; 
-                border: none; 
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 9px;
-            }}
-            QPushButton:hover {{
-                background-color: {get_color('text_link')};
-            }}
-        """
-        if hasattr(self, 'btn_populate'):
-            self.btn_populate.setStyleSheet(style)
-        if hasattr(self, 'btn_edit'):
-            # Only apply default style if NOT in edit mode
-            if not getattr(self, 'is_editing', False):
-                self.btn_edit.setStyleSheet(style)
-        if hasattr(self, 'btn_import'):
-            self.btn_import.setStyleSheet(style)
-        if hasattr(self, 'btn_load'):
-            self.btn_load.setStyleSheet(style)
-        if hasattr(self, 'btn_rename'):
-            self.btn_rename.setStyleSheet(style)
-        if hasattr(self, 'btn_wiki'):
-            self.btn_wiki.setStyleSheet(style)
+
+_DEFAULT_PEN = QPen()
 
 class SkillItemDelegate(QStyledItemDelegate):
     """
@@ -722,57 +1108,112 @@ class SkillItemDelegate(QStyledItemDelegate):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.icon_size = 64 # Default size
+        self._font_small = QFont("Arial", 8)
+        self._font_large = QFont("Arial", 11)
+        # (name, font, width) -> QStaticText, so each name is wrapped and shaped once instead of every paint
+        self._static_texts = {}
+        self._geom_key = None # (width, height, icon_size) the offsets below were computed for
+        self._icon_dx = self._text_dy = self._text_w = self._text_h = 0
+        self.refresh_theme()
+
+    def refresh_theme(self):
+        c = get_theme_snapshot()
+        # (brush, pen) per item state, looked up once per paint
+        self._state_styles = {
+            "hover": (QBrush(QColor(c["bg_hover"])), QPen(QColor(c["border_light"]))),
+            "selected": (QBrush(QColor(c["bg_selected"])), QPen(QColor(c["border_accent"]))),
+            "normal": (QBrush(QColor(c["bg_secondary"])), QPen(QColor(c["border"]))),
+        }
+        self._text_pen = QPen(QColor(c["text_primary"]))
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.Type.ToolTip and isinstance(view, SkillLibraryWidget):
+            text = view.build_item_tooltip(index)
+            if text:
+                QToolTip.showText(event.globalPos(), text, view)
+                return True
+        return super().helpEvent(event, view, option, index)
 
     def sizeHint(self, option, index):
         return QSize(self.icon_size + 10, self.icon_size + 80)
 
+    def _static_text(self, name, font, width):
+        key = (name, font is self._font_large, width)
+        st = self._static_texts.get(key, False)
+        if st is False:
+            st = QStaticText(name)
+            st.setTextFormat(Qt.TextFormat.PlainText)
+            st.setTextOption(QTextOption(Qt.AlignmentFlag.AlignHCenter))
+            st.setTextWidth(width)
+            st.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+            st.prepare(font=font)
+            if st.size().width() > width:
+                # A word wider than the cell: drawText centres each line on its own, keep that path
+                st = None
+            self._static_texts[key] = st
+        return st
+
+    def _update_geometry(self, width, height):
+        # Items share one size, so icon/text placement relative to the cell is computed once
+        self._geom_key = (width, height, self.icon_size)
+        self._icon_dx = (width - 1) // 2 - self.icon_size // 2
+        self._text_dy = self.icon_size + 15
+        self._text_w = width - 4
+        self._text_h = height - self.icon_size - 18
+
     def paint(self, painter, option, index):
         if not index.isValid(): return
 
-        painter.save()
+        # No save()/restore(): only the state read below is set, and the hint and font only
+        # when the painter lacks them, so the items of one view pass switch them once
+        font = self._font_small if self.icon_size <= 64 else self._font_large # Base 8, larger with big icons
+        if not painter.testRenderHint(QPainter.RenderHint.Antialiasing):
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if painter.font() != font:
+            painter.setFont(font)
         
         # Data Retrieval
         name = index.data(Qt.ItemDataRole.DisplayRole)
-        icon = index.data(Qt.ItemDataRole.DecorationRole)
+        icon_file = index.data(ICON_FILE_ROLE)
         
         # Style Setup
         rect = option.rect
         rect.adjust(2, 2, -2, -2) # Margin
         
         # Background & Border
-        if option.state & QStyle.StateFlag.State_MouseOver:
-            painter.setBrush(QColor(get_color("bg_hover")))
-            painter.setPen(QColor(get_color("border_light")))
-        elif option.state & QStyle.StateFlag.State_Selected:
-            painter.setBrush(QColor(get_color("bg_selected")))
-            painter.setPen(QColor(get_color("border_accent")))
+        state = option.state
+        if state & QStyle.StateFlag.State_MouseOver:
+            brush, pen = self._state_styles["hover"]
+        elif state & QStyle.StateFlag.State_Selected:
+            brush, pen = self._state_styles["selected"]
         else:
-            painter.setBrush(QColor(get_color("bg_secondary")))
-            painter.setPen(QColor(get_color("border")))
-            
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            brush, pen = self._state_styles["normal"]
+        painter.setBrush(brush)
+        painter.setPen(pen)
         painter.drawRoundedRect(rect, 4, 4)
+
+        left, top, width, height = rect.left(), rect.top(), rect.width(), rect.height()
+        if self._geom_key != (width, height, self.icon_size):
+            self._update_geometry(width, height)
         
         # Icon
-        icon_x = rect.center().x() - (self.icon_size // 2)
-        icon_y = rect.top() + 10
-        icon_rect = QRect(icon_x, icon_y, self.icon_size, self.icon_size)
-        
-        if icon:
-            painter.drawPixmap(icon_rect, icon.pixmap(self.icon_size, self.icon_size))
+        if icon_file:
+            pix = _get_icon_pixmap(icon_file, self.icon_size)
+            if pix is not None:
+                painter.drawPixmap(left + self._icon_dx, top + 10, self.icon_size, self.icon_size, pix)
         
         # Text
-        text_y = icon_y + self.icon_size + 5
-        text_height = rect.bottom() - text_y - 2
-        text_rect = QRect(rect.left() + 2, text_y, rect.width() - 4, text_height)
-        
-        painter.setPen(QColor(get_color("text_primary")))
-        # Scale font size: Base 8, increases slightly with icon size
-        font_size = 8 if self.icon_size <= 64 else 11
-        painter.setFont(QFont("Arial", font_size))
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, name)
-        
-        painter.restore()
+        text_x, text_y = left + 2, top + self._text_dy
+        painter.setPen(self._text_pen)
+        st = self._static_text(name, font, self._text_w)
+        if st is None:
+            painter.drawText(QRect(text_x, text_y, self._text_w, self._text_h), Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, name)
+        else:
+            painter.drawStaticText(QPointF(text_x, text_y + (self._text_h - st.size().height()) / 2), st)
+
+        # Hand back QPainter's default pen and brush; the style's drop indicator draws with them
+        painter.setPen(_DEFAULT_PEN)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
 
 class SkillLibraryWidget(QListWidget):
     """
@@ -782,15 +1223,58 @@ class SkillLibraryWidget(QListWidget):
     skill_double_clicked = pyqtSignal(object)
     builds_reordered = pyqtSignal(int, int) # source_index, target_index
 
+    _STYLESHEET = """
+            QListWidget {{ 
+                background-color: {bg_primary}; 
+                border: none; 
+            }}
+            QListWidget::item {{
+                border-bottom: 1px solid {border};
+            }}
+            QListWidget::item:hover {{
+                background-color: {bg_hover};
+            }}
+            QListWidget::item:selected {{
+                background-color: {bg_selected};
+            }}
+        """
+
     def __init__(self, repo, engine=None, parent=None):
         super().__init__(parent)
         self.repo = repo      
         self.engine = engine  
         self.drop_row = -1 # Track for manual painting
+        self._drop_line_y = -1 # Viewport y of the drop indicator, computed in dragMoveEvent
+        self._row_tops = None # Content y of each row's top, rebuilt on demand for drag hit-testing
+        self._populating = False # Set while a list is refilled so per-row model signals are folded into one
+        self._tooltip_cache = (None, "") # (key, html) of the last built item tooltip; hover re-fires ToolTip events
+        self._has_previews = False # Any BuildPreviewWidget row since the last clear(); skill lists skip row walks
+        self._row_h = 0
+        self._last_bottom_y = 0 # Content y of the last row's bottom edge, cached with _row_tops
+        self._drop_pen = None # Built on first indicator paint, reset on theme change
+        self._placeholder_color = None # Same lifetime as _drop_pen
+        self._placeholder_font = None # Viewport font at 12pt, same lifetime as _drop_pen
+        self._vp_width = 0 # Viewport width for the indicator, refreshed on resize and drag enter
+        # Drag moves can arrive far faster than the display refreshes, so indicator
+        # repaints are collected into one dirty region and flushed at most every 16ms
+        self._dirty_region = QRegion()
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._flush_drop_line)
+        # Wheel ticks are summed the same way and applied as one scroll per frame
+        self._pending_wheel = 0.0
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(16)
+        self._wheel_timer.timeout.connect(self._flush_wheel)
         
         self.setViewMode(QListWidget.ViewMode.IconMode)
         self.setResizeMode(QListWidget.ResizeMode.Adjust)
         self.setUniformItemSizes(True)
+        # Lay items out incrementally so large lists paint before population finishes
+        self.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.setBatchSize(64)
         self.setDragEnabled(True)
         self.setAcceptDrops(True)
         self.setDropIndicatorShown(True)
@@ -800,10 +1284,18 @@ class SkillLibraryWidget(QListWidget):
         
         self.delegate = SkillItemDelegate(self)
         self.setItemDelegate(self.delegate)
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
 
         self.itemClicked.connect(self._on_item_clicked)
         self.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.model().rowsInserted.connect(self._on_rows_changed)
+        self.model().rowsRemoved.connect(self._on_rows_changed)
+        self.model().dataChanged.connect(self._invalidate_row_geometry) # Size hints live in item data
+        self._theme_gen_applied = -1
+        self._style_key = None # Colours the current stylesheet was built from
         self.refresh_theme()
+        THEME_SIGNALS.theme_changed.connect(self.refresh_theme)
 
     def wheelEvent(self, event):
         """ Override wheel event to make scrolling less sensitive. """
@@ -812,9 +1304,94 @@ class SkillLibraryWidget(QListWidget):
         delta = event.angleDelta().y()
         # Scale down the scroll amount - 80 pixels per click (approx one row)
         scroll_amount = -1 * (delta / 120) * 80 
-        self.verticalScrollBar().setValue(int(self.verticalScrollBar().value() + scroll_amount))
+        self._pending_wheel += scroll_amount
+        if not self._wheel_timer.isActive():
+            self._wheel_timer.start()
         event.accept()
 
+    def _flush_wheel(self):
+        bar = self.verticalScrollBar()
+        bar.setValue(int(bar.value() + self._pending_wheel))
+        self._pending_wheel = 0.0
+
+    def _invalidate_row_geometry(self, *args):
+        self._row_tops = None
+
+    def _ensure_row_geometry(self):
+        if self._row_tops is None:
+            count = self.count()
+            offset = self.verticalOffset()
+            if count > 1 and self.viewMode() == QListWidget.ViewMode.ListMode:
+                # Uniform item sizes give every row the same pitch, so two rects are enough
+                first = self.visualItemRect(self.item(0))
+                top = first.top() + offset
+                pitch = self.visualItemRect(self.item(1)).top() + offset - top
+                self._row_tops = [top + i * pitch for i in range(count)]
+                self._row_h = first.height()
+                self._last_bottom_y = self._row_tops[-1] + self._row_h - 1
+            else:
+                rects = [self.visualItemRect(self.item(i)) for i in range(count)]
+                self._row_tops = [r.top() + offset for r in rects]
+                self._row_h = rects[0].height() if rects else 0
+                self._last_bottom_y = rects[-1].bottom() + offset if rects else 0
+        return self._row_tops
+
+    def _begin_populate(self):
+        # Only the row-geometry slot is muted; selection/current-item signals still reach listeners
+        self.setUpdatesEnabled(False)
+        self._populating = True
+
+    def _end_populate(self):
+        self._populating = False
+        self._on_rows_changed()
+        self.setUpdatesEnabled(True)
+        self.viewport().update()
+
+    def _on_rows_changed(self, *args):
+        if self._populating:
+            return
+        self._row_tops = None
+        # Row geometry moved under the indicator, so the cached line is stale
+        if self.drop_row != -1:
+            self._drop_line_y = self._calc_drop_line_y(self.drop_row)
+
+    def resizeEvent(self, event):
+        self._row_tops = None
+        super().resizeEvent(event)
+        self._vp_width = self.viewport().width()
+
+    def scrollContentsBy(self, dx, dy):
+        # Keep the cached indicator in step with auto-scroll during a drag
+        self._drop_line_y += dy
+        if not self._dirty_region.isEmpty():
+            self._dirty_region.translate(0, dy)
+        if dy:
+            self._build_visible_previews()
+        super().scrollContentsBy(dx, dy)
+
+    def _build_visible_previews(self):
+        # Build rows scrolled into view before the viewport repaints, avoiding a blank frame
+        if not self._has_previews or self.viewMode() != QListWidget.ViewMode.ListMode:
+            return
+        vp = self.viewport().rect()
+        first = self.indexAt(QPoint(1, vp.top())).row()
+        if first < 0:
+            return
+        last = self.indexAt(QPoint(1, vp.bottom())).row()
+        if last < 0:
+            last = self.count() - 1
+        for row in range(first, last + 1):
+            widget = self.itemWidget(self.item(row))
+            if isinstance(widget, BuildPreviewWidget):
+                widget.ensure_built()
+
+    def _calc_drop_line_y(self, drop_row):
+        tops = self._ensure_row_geometry()
+        if not tops:
+            return 0
+        y = tops[drop_row] if drop_row < len(tops) else self._last_bottom_y
+        return y - self.verticalOffset()
+
     def _on_item_clicked(self, item):
         data = item.data(Qt.ItemDataRole.UserRole)
         if not isinstance(data, Build):
@@ -826,137 +1403,154 @@ class SkillLibraryWidget(QListWidget):
             self.skill_double_clicked.emit(data)
 
     def refresh_theme(self):
-        self.setStyleSheet(f"""
-            QListWidget {{ 
-                background-color: {get_color('bg_primary')}; 
-                border: none; 
-            }}
-            QListWidget::item {{
-                border-bottom: 1px solid {get_color('border')};
-            }}
-            QListWidget::item:hover {{
-                background-color: {get_color('bg_hover')};
-            }}
-            QListWidget::item:selected {{
-                background-color: {get_color('bg_selected')};
-            }}
-        """)
+        if self._theme_gen_applied == theme.THEME_GEN: return
+        self._theme_gen_applied = theme.THEME_GEN
+        c = get_theme_snapshot()
+        self.delegate.refresh_theme()
+        self._drop_pen = None
+        self._placeholder_color = None
+        self._placeholder_font = None
+        # setStyleSheet re-polishes every row widget, so skip it when these colours didn't change
+        style_key = (c['bg_primary'], c['border'], c['bg_hover'], c['bg_selected'])
+        if style_key != self._style_key:
+            self._style_key = style_key
+            self.setStyleSheet(self._STYLESHEET.format_map(c))
         self.viewport().update()
 
-    def update_suggestions(self, suggestions):
-        self.clear() 
-        sorted_suggestions = sorted(suggestions, key=lambda x: x[1], reverse=True)
-
-        for item in sorted_suggestions:
-            if len(item) == 3:
-                sid, score, reason = item
-            else:
-                sid, score = item
-                reason = "Neural Synergy"
-
-            skill = self.repo.get_skill(sid)
-            if not skill: continue
+    def build_item_tooltip(self, index):
+        """ Builds the HTML tooltip for a library entry from its stored tooltip args. """
+        args = index.data(_TOOLTIP_ARGS_ROLE)
+        if args is None:
+            return ""
+        sid = index.data(Qt.ItemDataRole.UserRole)
+        key = (sid, args, theme.THEME_GEN)
+        if self._tooltip_cache[0] == key:
+            return self._tooltip_cache[1]
+        html = self._format_item_tooltip(self.repo.get_skill(sid), args)
+        self._tooltip_cache = (key, html)
+        return html
+
+    def _format_item_tooltip(self, skill, args):
+        if not skill:
+            return ""
+        type_str = f"<i>{skill.skill_type.title()}</i><br/>" if skill.skill_type else ""
+        attr_str = f"<i>{skill.get_attribute_str()}</i><br/>" if skill.attribute != -1 else ""
+        if not args:
+            return f"<b>{skill.name}</b><br/>{attr_str}{type_str}<hr/>{skill.description}"
+        reason, confidence_pct = args
+        return (
+            f"<b>{skill.name}</b><br/>"
+            f"{attr_str}"
+            f"{type_str}"
+            f"<span style='color:{get_color('text_accent')};'>Match: {reason}</span><br/>"
+            f"Confidence: {confidence_pct}%<br/><hr/>"
+            f"{skill.description}"
+        )
 
-            list_item = QListWidgetItem()
-            list_item.setText(skill.name)
-            list_item.setData(Qt.ItemDataRole.UserRole, sid)
-            
-            confidence_pct = int(score * 100)
-            attr_name = skill.get_attribute_str()
-            type_str = f"<i>{skill.skill_type.title()}</i><br/>" if skill.skill_type else ""
-            attr_str = f"<i>{attr_name}</i><br/>" if skill.attribute != -1 else ""
-
-            tooltip_text = (
-                f"<b>{skill.name}</b><br/>"
-                f"{attr_str}"
-                f"{type_str}"
-                f"<span style='color:{get_color('text_accent')};'>Match: {reason}</span><br/>"
-                f"Confidence: {confidence_pct}%<br/><hr/>"
-                f"{skill.description}"
-            )
-            list_item.setToolTip(tooltip_text)
+    def update_suggestions(self, suggestions):
+        self._begin_populate()
+        try:
+            self.clear() 
+            # Engine results come as (sid, score) or (sid, score, reason); give them one shape up front
+            sorted_suggestions = [item if len(item) == 3 else (*item, "Neural Synergy") for item in suggestions]
+            sorted_suggestions.sort(key=itemgetter(1), reverse=True)
+
+            for sid, score, reason in sorted_suggestions:
+                skill = self.repo.get_skill(sid)
+                if not skill: continue
+
+                list_item = QListWidgetItem()
+                list_item.setText(skill.name)
+                list_item.setData(Qt.ItemDataRole.UserRole, sid)
             
-            icon_path = os.path.join(ICON_DIR, skill.icon_filename)
-            if os.path.exists(icon_path):
-                key = f"{skill.icon_filename}_{self.delegate.icon_size}"
-                if key in PIXMAP_CACHE:
-                    pixmap = PIXMAP_CACHE[key]
-                else:
-                    pixmap = QPixmap(icon_path).scaled(
-                        self.delegate.icon_size, self.delegate.icon_size, 
-                        Qt.AspectRatioMode.KeepAspectRatio, 
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    PIXMAP_CACHE[key] = pixmap
-                list_item.setIcon(QIcon(pixmap))
+                list_item.setData(_TOOLTIP_ARGS_ROLE, (reason, int(score * 100)))
+                list_item.setData(ICON_FILE_ROLE, skill.icon_filename)
             
-            if score > 0.85:
-                font = list_item.font()
-                font.setBold(True)
-                list_item.setFont(font)
+                if score > 0.85:
+                    list_item.setFont(self._bold_font)
 
-            self.addItem(list_item)
+                self.addItem(list_item)
+        finally:
+            self._end_populate()
 
     def update_standard_list(self, skill_ids):
-        self.clear()
-        for sid in skill_ids:
-            skill = self.repo.get_skill(sid)
-            if not skill: continue
-            
-            list_item = QListWidgetItem()
-            list_item.setText(skill.name)
-            list_item.setData(Qt.ItemDataRole.UserRole, sid)
-            
-            attr_name = skill.get_attribute_str()
-            type_str = f"<i>{skill.skill_type.title()}</i><br/>" if skill.skill_type else ""
-            attr_str = f"<i>{attr_name}</i><br/>" if skill.attribute != -1 else ""
+        self._begin_populate()
+        try:
+            self.clear()
+            for sid in skill_ids:
+                skill = self.repo.get_skill(sid)
+                if not skill: continue
             
-            list_item.setToolTip(f"<b>{skill.name}</b><br/>{attr_str}{type_str}<hr/>{skill.description}")
+                list_item = QListWidgetItem()
+                list_item.setText(skill.name)
+                list_item.setData(Qt.ItemDataRole.UserRole, sid)
             
-            icon_path = os.path.join(ICON_DIR, skill.icon_filename)
-            if os.path.exists(icon_path):
-                current_size = self.delegate.icon_size
-                key = f"{skill.icon_filename}_{current_size}"
-                if key in PIXMAP_CACHE:
-                    pix = PIXMAP_CACHE[key]
-                else:
-                    pix = QPixmap(icon_path).scaled(
-                        current_size, current_size,
-                        Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-                    )
-                    PIXMAP_CACHE[key] = pix
-                list_item.setIcon(QIcon(pix))
+                list_item.setData(_TOOLTIP_ARGS_ROLE, ())
+                list_item.setData(ICON_FILE_ROLE, skill.icon_filename)
             
-            self.addItem(list_item)
+                self.addItem(list_item)
+        finally:
+            self._end_populate()
 
     def update_zone_summary(self, monsters):
-        self.clear()
-        self.setViewMode(QListWidget.ViewMode.ListMode)
-        self.setSpacing(2)
-        
-        for m in monsters:
-            item = QListWidgetItem(m['name'])
-            item.setData(Qt.ItemDataRole.UserRole, m) 
-            if m.get('is_boss'):
-                item.setForeground(QColor(get_color("text_warning")))
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
-            self.addItem(item)
+        self._begin_populate()
+        try:
+            self.clear()
+            # Both setters relayout even when nothing changes, so only call them on a switch
+            if self.viewMode() != QListWidget.ViewMode.ListMode:
+                self.setViewMode(QListWidget.ViewMode.ListMode)
+            if self.spacing() != 2:
+                self.setSpacing(2)
+
+            boss_color = QColor(get_color("text_warning"))
+            for m in monsters:
+                item = QListWidgetItem(m['name'])
+                item.setData(Qt.ItemDataRole.UserRole, m) 
+                if m.get('is_boss'):
+                    item.setForeground(boss_color)
+                    item.setFont(self._bold_font)
+                self.addItem(item)
+        finally:
+            self._end_populate()
+
+    def setItemWidget(self, item, widget):
+        if isinstance(widget, BuildPreviewWidget):
+            self._has_previews = True
+        super().setItemWidget(item, widget)
+
+    def clear(self):
+        self._has_previews = False
+        super().clear()
 
     def set_icon_size(self, size):
+        size_changed = size != self.delegate.icon_size
         self.delegate.icon_size = size
+        self._row_tops = None
         
         # Propagate to BuildPreviewWidgets if they exist
-        for i in range(self.count()):
-            item = self.item(i)
-            widget = self.itemWidget(item)
-            if isinstance(widget, BuildPreviewWidget):
-                widget.set_icon_size(size)
-                # Adjust item size hint
-                item.setSizeHint(QSize(500, widget.sizeHint().height()))
-        
-        self.model().layoutChanged.emit()
+        if self._has_previews:
+            for i in range(self.count()):
+                item = self.item(i)
+                widget = self.itemWidget(item)
+                if isinstance(widget, BuildPreviewWidget):
+                    widget.set_icon_size(size)
+                    # Adjust item size hint
+                    item.setSizeHint(QSize(500, widget.sizeHint().height()))
+        
+        if size_changed:
+            # Delegate size hints depend on icon_size, so relayout right away
+            self.doItemsLayout()
+        elif self._has_previews:
+            self.scheduleDelayedItemsLayout()
+        self.viewport().update()
+
+    def refresh_icons(self):
+        """ Repaints library icons and re-fetches build preview icons from the cache. """
+        if self._has_previews:
+            for i in range(self.count()):
+                widget = self.itemWidget(self.item(i))
+                if isinstance(widget, BuildPreviewWidget):
+                    widget.refresh_icons()
         self.viewport().update()
 
     def startDrag(self, supportedActions):
@@ -967,89 +1561,114 @@ class SkillLibraryWidget(QListWidget):
         if isinstance(data, Build):
             drag = QDrag(self)
             mime_data = QMimeData()
-            mime_data.setText(f"reorder_build:{self.row(item)}")
+            source_row = self.row(item)
+            mime_data.setText(f"reorder_build:{source_row}")
+            mime_data.setData(_REORDER_MIME, source_row.to_bytes(4, "little"))
             drag.setMimeData(mime_data)
             
             widget = self.itemWidget(item)
             if widget:
-                # Create a semi-transparent thumbnail
-                pixmap = widget.grab()
-                transparent_pix = QPixmap(pixmap.size())
-                transparent_pix.fill(Qt.GlobalColor.transparent)
-                p = QPainter(transparent_pix)
-                p.setOpacity(0.6)
-                p.drawPixmap(0, 0, pixmap)
-                p.end()
-                
-                drag.setPixmap(transparent_pix.scaled(400, widget.height(), Qt.AspectRatioMode.KeepAspectRatio))
+                drag.setPixmap(widget.drag_thumbnail())
                 drag.setHotSpot(QPoint(200, widget.height() // 2))
             
             drag.exec(Qt.DropAction.MoveAction)
             return
 
         skill_id = data
-        icon = item.icon()
         drag = QDrag(self)
         mime_data = QMimeData()
         mime_data.setText(str(skill_id))
         drag.setMimeData(mime_data)
-        if not icon.isNull():
-            drag.setPixmap(icon.pixmap(64, 64))
-            drag.setHotSpot(QPoint(32, 32))
+        pix = _get_icon_pixmap(item.data(ICON_FILE_ROLE), DRAG_CURSOR_SIZE)
+        if pix is not None:
+            drag.setPixmap(pix)
+            drag.setHotSpot(QPoint(DRAG_CURSOR_SIZE // 2, DRAG_CURSOR_SIZE // 2))
         drag.exec(Qt.DropAction.CopyAction)
 
     def dragEnterEvent(self, event):
-        if event.mimeData().hasText() and event.mimeData().text().startswith("reorder_build:"):
+        # Scroll bars can appear after the last resize, so re-read the width per drag
+        self._vp_width = self.viewport().width()
+        if _reorder_source_row(event.mimeData()) is not None:
             event.acceptProposedAction()
         else:
             super().dragEnterEvent(event)
 
+    def _update_drop_line(self, y):
+        # Repaint only the band the 3px indicator occupies at y
+        self._dirty_region += QRect(0, y - 2, self._vp_width, 5)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _flush_drop_line(self):
+        self.viewport().update(self._dirty_region)
+        self._dirty_region = QRegion()
+
+    def _clear_drop_line(self):
+        if self.drop_row != -1:
+            self.drop_row = -1
+            self._update_drop_line(self._drop_line_y)
+
     def dragLeaveEvent(self, event):
-        self.drop_row = -1
-        self.viewport().update()
+        self._clear_drop_line()
         super().dragLeaveEvent(event)
 
+    def _drop_row_at(self, viewport_y):
+        """ Row a build dropped at viewport_y lands before; count() below the last row or in a gap. """
+        # Rows share one height, so hit-test by bisecting the cached row tops
+        tops = self._ensure_row_geometry()
+        y = viewport_y + self.verticalOffset()
+        idx = bisect_right(tops, y) - 1
+        if 0 <= idx and y < tops[idx] + self._row_h:
+            # If in bottom half of item, drop AFTER it
+            return idx + (y - tops[idx] > (self._row_h - 1) // 2)
+        return len(tops)
+
     def dragMoveEvent(self, event):
         super().dragMoveEvent(event)
-        if event.mimeData().hasText() and event.mimeData().text().startswith("reorder_build:"):
+        if _reorder_source_row(event.mimeData()) is not None:
             event.acceptProposedAction()
             
             # Update manual drop indicator
-            pos = event.position().toPoint()
-            item = self.itemAt(pos)
-            if item:
-                self.drop_row = self.row(item)
-                # If in bottom half of item, indicate drop AFTER it
-                if pos.y() > self.visualItemRect(item).center().y():
-                    self.drop_row += 1
+            drop_row = self._drop_row_at(event.position().toPoint().y())
+            
+            # Most moves stay within the same half-row; nothing to repaint then
+            if drop_row == self.drop_row:
+                return
+            tops = self._row_tops # Fresh, _drop_row_at just ensured it
+            offset = self.verticalOffset()
+            if self.drop_row != -1:
+                self._update_drop_line(self._drop_line_y)
+            self.drop_row = drop_row
+            # Resolve the line here so paintEvent only has to draw it:
+            # top edge of the drop row, or bottom edge of the last row
+            if drop_row < len(tops):
+                self._drop_line_y = tops[drop_row] - offset
+            elif tops:
+                self._drop_line_y = self._last_bottom_y - offset
             else:
-                self.drop_row = self.count()
-            self.viewport().update()
+                self._drop_line_y = 0
+            self._update_drop_line(self._drop_line_y)
 
     def dropEvent(self, event):
-        self.drop_row = -1
-        self.viewport().update()
+        self._clear_drop_line()
         
-        if event.mimeData().hasText() and event.mimeData().text().startswith("reorder_build:"):
-            source_row = int(event.mimeData().text().split(":")[1])
-            drop_pos = event.position().toPoint()
-            target_item = self.itemAt(drop_pos)
-            
-            if target_item:
-                target_row = self.row(target_item)
-                if drop_pos.y() > self.visualItemRect(target_item).center().y():
-                    target_row += 1
-            else:
-                target_row = self.count()
+        source_row = _reorder_source_row(event.mimeData())
+        if source_row is not None:
+            target_row = self._drop_row_at(event.position().toPoint().y())
             
-            if source_row < target_row:
-                target_row -= 1
-                
-            if source_row != target_row and target_row >= 0:
-                self.builds_reordered.emit(source_row, target_row)
-                event.acceptProposedAction()
-            else:
+            # Removing the source shifts every later row up by one
+            effective_target = target_row - 1 if source_row < target_row else target_row
+            # Dropping onto either edge of the build itself is a no-op
+            if effective_target == source_row or effective_target < 0:
                 event.ignore()
+                return
+            
+            # The reorder rebuilds the whole list; hold repaints until that has run.
+            # Queued slots run in post order, so re-enable only after the emit.
+            self.setUpdatesEnabled(False)
+            self.builds_reordered.emit(source_row, effective_target)
+            QTimer.singleShot(0, lambda: self.setUpdatesEnabled(True))
+            event.acceptProposedAction()
             return
         super().dropEvent(event)
 
@@ -1058,34 +1677,37 @@ class SkillLibraryWidget(QListWidget):
         
         # Show placeholder text if empty
         if self.count() == 0:
+            if self._placeholder_color is None:
+                self._placeholder_color = QColor(get_color("text_tertiary"))
             painter = QPainter(self.viewport())
-            painter.setPen(QColor(get_color("text_tertiary")))
-            # Use a reasonably sized font
-            font = painter.font()
-            font.setPointSize(12)
-            painter.setFont(font)
-            
-            rect = self.viewport().rect()
-            text = "Select a category or teambuild to view"
-            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, text)
-            painter.end()
+            try:
+                painter.setPen(self._placeholder_color)
+                if self._placeholder_font is None:
+                    # Use a reasonably sized font
+                    self._placeholder_font = QFont(painter.font())
+                    self._placeholder_font.setPointSize(12)
+                painter.setFont(self._placeholder_font)
+                
+                rect = self.viewport().rect()
+                text = "Select a category or teambuild to view"
+                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, text)
+            finally:
+                painter.end()
 
-        if self.drop_row != -1:
-            from PyQt6.QtGui import QPen
-            painter = QPainter(self.viewport())
-            pen = QPen(QColor(get_color("text_link")))
-            pen.setWidth(3)
-            painter.setPen(pen)
-            
-            # Calculate line position
-            if self.drop_row < self.count():
-                rect = self.visualItemRect(self.item(self.drop_row))
-                y = rect.top()
-            else:
-                rect = self.visualItemRect(self.item(self.count() - 1))
-                y = rect.bottom()
-            
-            painter.drawLine(0, y, self.viewport().width(), y)
+        if self.drop_row == -1:
+            return
+        # Skip the indicator when only unrelated rows are being repainted
+        if not event.rect().intersects(QRect(0, self._drop_line_y - 2, self._vp_width, 5)):
+            return
+        if self._drop_pen is None:
+            self._drop_pen = QPen(QColor(get_color("text_link")))
+            self._drop_pen.setWidth(3)
+        
+        painter = QPainter(self.viewport())
+        try:
+            painter.setPen(self._drop_pen)
+            # Line position is computed in dragMoveEvent
+            y = self._drop_line_y
+            painter.drawLine(0, y, self._vp_width, y)
+        finally:
             painter.end()
-
-    
\ No newline at end of file
@@ -5,7 +5,7 @@ import sqlite3
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit, QListWidget, QMessageBox, QFileDialog, QInputDialog, QTabWidget, QTextEdit, QFrame, QScrollArea, QGridLayout, QWidget, QMenu
 )
-from PyQt6.QtCore import QUrl, QSettings, Qt
+from PyQt6.QtCore import QUrl, QSettings, Qt, QTimer
 from PyQt6.QtGui import QPixmap, QAction
 
 try:
@@ -16,11 +16,31 @@ except ImportError:
     HAS_WEBENGINE = False
 
 from src.ui.theme import get_color
-from src.constants import PROF_MAP, JSON_FILE, ICON_DIR, ICON_SIZE, ATTR_MAP, PROF_SHORT_MAP, DB_FILE
+from src.constants import PROF_MAP, JSON_FILE, ICON_FILES, icon_path, ICON_SIZE, ATTR_MAP, PROF_SHORT_MAP, DB_FILE
 from src.utils import GuildWarsTemplateDecoder, GuildWarsTemplateEncoder
 from src.models import Build
 from src.engine import CONDITION_DEFINITIONS
 
+def _narrow_list(list_widget, shown, search_text):
+    """
+    Drops the rows of list_widget that no longer contain search_text, for a search that
+    extends the previous one. shown holds (name, lowercase name) per row; returns what's left.
+    """
+    kept = []
+    list_widget.setUpdatesEnabled(False)
+    list_widget.blockSignals(True)
+    try:
+        for row in range(len(shown) - 1, -1, -1):
+            if search_text in shown[row][1]:
+                kept.append(shown[row])
+            else:
+                list_widget.takeItem(row)
+    finally:
+        list_widget.blockSignals(False)
+        list_widget.setUpdatesEnabled(True)
+    kept.reverse()
+    return kept
+
 class TeamSummaryDialog(QDialog):
     def __init__(self, team_name, builds, repo, parent=None):
         super().__init__(parent)
@@ -248,9 +268,19 @@ class TeamManagerWidget(QWidget):
         self.edit_search = QLineEdit()
         self.edit_search.setPlaceholderText("Search teams...")
         self.edit_search.setStyleSheet("QLineEdit::placeholder { color: white; }")
-        self.edit_search.textChanged.connect(self.refresh_list)
+        # Debounce timer so a burst of keystrokes refreshes the list once
+        self.search_debounce_timer = QTimer(self)
+        self.search_debounce_timer.setSingleShot(True)
+        self.search_debounce_timer.setInterval(150)
+        self.search_debounce_timer.timeout.connect(self._on_search_changed)
+        self.edit_search.textChanged.connect(self.search_debounce_timer.start)
         layout.addWidget(self.edit_search)
         
+        # What the list shows, so a search that extends the last one only drops rows
+        self._last_search = None
+        self._shown = []
+        self._teams_seen = set()
+        self._sorted_teams = [] # (name, lowercase name) for _teams_seen, sorted by name
         self.list_widget = QListWidget()
         self.refresh_list()
         layout.addWidget(self.list_widget)
@@ -277,11 +307,33 @@ class TeamManagerWidget(QWidget):
         layout.addLayout(btn_layout)
 
     def refresh_list(self):
-        self.list_widget.clear()
         search_text = self.edit_search.text().lower()
-        teams = sorted(list(self.engine.teams))
-        filtered_teams = [t for t in teams if search_text in t.lower()]
-        self.list_widget.addItems(filtered_teams)
+        # Re-sort only when the engine's teams changed since the last refresh
+        if self.engine.teams != self._teams_seen:
+            self._teams_seen = set(self.engine.teams)
+            self._sorted_teams = [(t, t.lower()) for t in sorted(self._teams_seen)]
+        pairs = self._sorted_teams
+        # An empty search matches everything; skip the scan
+        self._shown = [pair for pair in pairs if search_text in pair[1]] if search_text else pairs
+        self._last_search = search_text
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            self.list_widget.clear()
+            self.list_widget.addItems([t for t, _ in self._shown])
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
+
+    def _on_search_changed(self):
+        search_text = self.edit_search.text().lower()
+        # Teams can change behind this widget (it stays embedded in the main window)
+        if (self._last_search is not None and search_text.startswith(self._last_search)
+                and self.engine.teams == self._teams_seen):
+            self._shown = _narrow_list(self.list_widget, self._shown, search_text)
+            self._last_search = search_text
+        else:
+            self.refresh_list()
         
     def show_new_team_menu(self):
         menu = QMenu(self)
@@ -344,6 +396,7 @@ class TeamManagerWidget(QWidget):
             b.is_user_build = True
             self.engine.builds.append(b)
             
+        self.engine.invalidate_team_index()
         self.engine.save_user_builds()
         self.refresh_list()
         
@@ -388,7 +441,7 @@ class TeamManagerWidget(QWidget):
         
         settings.setValue("last_export_dir", os.path.dirname(export_dir))
 
-        matching_builds = [b for b in self.engine.builds if b.team == team_name]
+        matching_builds = self.engine.get_team_builds(team_name)
         if not matching_builds:
             QMessageBox.information(self, "Export", "No builds found to export.")
             return
@@ -451,7 +504,7 @@ class TeamManagerWidget(QWidget):
             return
             
         team_name = item.text()
-        existing_builds = [b for b in self.engine.builds if b.team == team_name]
+        existing_builds = self.engine.get_team_builds(team_name)
         category = existing_builds[0].category if existing_builds else "User Created"
         
         build_name, ok = QInputDialog.getText(self, "Build Name", "Enter a name for this build (optional):")
@@ -482,6 +535,7 @@ class TeamManagerWidget(QWidget):
         new_build.is_user_build = True
         
         self.engine.builds.append(new_build)
+        self.engine.invalidate_team_index()
         self.engine.teams.add(team_name)
         self.engine.save_user_builds()
         
@@ -520,7 +574,9 @@ class TeamManagerWidget(QWidget):
         
         confirm = QMessageBox.question(self, "Confirm", f"Delete all builds for team '{team_name}'?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if confirm == QMessageBox.StandardButton.Yes:
-            self.engine.builds = [b for b in self.engine.builds if b.team != team_name]
+            doomed = set(self.engine.builds_by_team.get(team_name, ()))
+            if doomed:
+                self.engine.builds = [b for b in self.engine.builds if b not in doomed]
             self.engine.teams.discard(team_name)
             self.engine.save_user_builds()
             self.refresh_list()
@@ -600,10 +656,10 @@ class TeamEditorDialog(QDialog):
         new_name, ok = QInputDialog.getText(self, "Rename Team", "Enter new team name:", text=self.team_name)
         if ok and new_name and new_name != self.team_name:
             # Update in memory
-            for b in self.engine.builds:
-                if b.team == self.team_name:
-                    b.team = new_name
-                    b.is_user_build = True 
+            for b in self.engine.get_team_builds(self.team_name):
+                b.team = new_name
+                b.is_user_build = True 
+            self.engine.invalidate_team_index()
             
             self.engine.teams.discard(self.team_name)
             self.engine.teams.add(new_name)
@@ -644,16 +700,22 @@ class TeamEditorDialog(QDialog):
                 self.parent().parent_window.apply_filters()
 
     def refresh_list(self):
-        self.list_widget.clear()
-        self.team_builds = [b for b in self.engine.builds if b.team == self.team_name]
+        self.team_builds = self.engine.get_team_builds(self.team_name)
         
-        for i, b in enumerate(self.team_builds):
-            # Try to describe the build
-            p1 = PROF_MAP.get(int(b.primary_prof), "X")
-            p2 = PROF_MAP.get(int(b.secondary_prof), "X")
-            name_str = f" ({b.name})" if b.name else ""
-            item_text = f"#{i+1}: {p1}/{p2}{name_str} - {b.code}"
-            self.list_widget.addItem(item_text)
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            self.list_widget.clear()
+            rows = []
+            for i, b in enumerate(self.team_builds, 1):
+                # Try to describe the build
+                p1, p2 = b.prof_names
+                name_str = f" ({b.name})" if b.name else ""
+                rows.append(f"#{i}: {p1}/{p2}{name_str} - {b.code}")
+            self.list_widget.addItems(rows)
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
 
     def remove_build(self):
         row = self.list_widget.currentRow()
@@ -664,6 +726,7 @@ class TeamEditorDialog(QDialog):
         # Remove from engine
         if build_to_remove in self.engine.builds:
             self.engine.builds.remove(build_to_remove)
+            self.engine.invalidate_team_index()
 
         # Save using centralized engine logic
         self.engine.save_user_builds()
@@ -677,15 +740,28 @@ class LocationManagerDialog(QDialog):
         self.setWindowTitle("Locations")
         self.resize(450, 600)
         self.db_path = db_path
+        # Locations don't change while the dialog is open, so load them once and filter in memory
+        self._all_zones, self._all_missions = self._load_locations()
+        self._all_zones_lc = [name.lower() for name in self._all_zones]
+        self._all_missions_lc = [name.lower() for name in self._all_missions]
         
         layout = QVBoxLayout(self)
         
         # Search Bar
         self.edit_search = QLineEdit()
         self.edit_search.setPlaceholderText("Search locations...")
-        self.edit_search.textChanged.connect(self.refresh_list)
+        # Debounce timer so a burst of keystrokes refreshes the list once
+        self.search_debounce_timer = QTimer(self)
+        self.search_debounce_timer.setSingleShot(True)
+        self.search_debounce_timer.setInterval(150)
+        self.search_debounce_timer.timeout.connect(self._on_search_changed)
+        self.edit_search.textChanged.connect(self.search_debounce_timer.start)
         layout.addWidget(self.edit_search)
         
+        # What each list shows, so a search that extends the last one only drops rows
+        self._last_search = None
+        self._shown_zones = []
+        self._shown_missions = []
         self.tabs = QTabWidget()
         
         self.list_zones = QListWidget()
@@ -709,27 +785,54 @@ class LocationManagerDialog(QDialog):
         
         self.refresh_list()
 
-    def refresh_list(self):
-        self.list_zones.clear()
-        self.list_missions.clear()
-        search_text = self.edit_search.text().lower()
+    def _load_locations(self):
+        """ Returns (zones, missions), each sorted by name. Empty lists if the DB can't be read. """
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
             # Load Explorable Zones
             cursor.execute("SELECT name FROM locations WHERE type = 'Location' ORDER BY name ASC")
-            zones = [row[0] for row in cursor.fetchall() if search_text in row[0].lower()]
-            self.list_zones.addItems(zones)
+            zones = [row[0] for row in cursor.fetchall()]
             
             # Load Missions
             cursor.execute("SELECT name FROM locations WHERE type = 'Mission' ORDER BY name ASC")
-            missions = [row[0] for row in cursor.fetchall() if search_text in row[0].lower()]
-            self.list_missions.addItems(missions)
+            missions = [row[0] for row in cursor.fetchall()]
             
             conn.close()
+            return zones, missions
         except Exception as e:
             print(f"Error loading locations: {e}")
+            return [], []
+
+    def refresh_list(self):
+        search_text = self.edit_search.text().lower()
+        zones = list(zip(self._all_zones, self._all_zones_lc))
+        missions = list(zip(self._all_missions, self._all_missions_lc))
+        if search_text: # An empty search matches everything; skip the scan
+            zones = [pair for pair in zones if search_text in pair[1]]
+            missions = [pair for pair in missions if search_text in pair[1]]
+        self._shown_zones = zones
+        self._shown_missions = missions
+        self._last_search = search_text
+        for lw, shown in ((self.list_zones, self._shown_zones), (self.list_missions, self._shown_missions)):
+            lw.setUpdatesEnabled(False)
+            lw.blockSignals(True)
+            try:
+                lw.clear()
+                lw.addItems([name for name, _ in shown])
+            finally:
+                lw.blockSignals(False)
+                lw.setUpdatesEnabled(True)
+
+    def _on_search_changed(self):
+        search_text = self.edit_search.text().lower()
+        if self._last_search is not None and search_text.startswith(self._last_search):
+            self._shown_zones = _narrow_list(self.list_zones, self._shown_zones, search_text)
+            self._shown_missions = _narrow_list(self.list_missions, self._shown_missions, search_text)
+            self._last_search = search_text
+        else:
+            self.refresh_list()
 
     def get_selected_location(self):
         # Check active tab
@@ -764,8 +867,7 @@ class BuildComparisonDialog(QDialog):
         layout.addSpacing(20)
         
         # Other Build
-        p1 = PROF_MAP.get(int(other_build.primary_prof) if other_build.primary_prof.isdigit() else 0, "X")
-        p2 = PROF_MAP.get(int(other_build.secondary_prof) if other_build.secondary_prof.isdigit() else 0, "X")
+        p1, p2 = other_build.prof_names
         layout.addWidget(QLabel(f"<b>Match: {p1}/{p2} - {other_build.team}:</b>"))
         
         other_row = QHBoxLayout()
@@ -791,9 +893,8 @@ class BuildComparisonDialog(QDialog):
         lbl.setScaledContents(True)
         
         if skill:
-            path = os.path.join(ICON_DIR, skill.icon_filename)
-            if os.path.exists(path):
-                pix = QPixmap(path)
+            if skill.icon_filename in ICON_FILES:
+                pix = QPixmap(icon_path(skill.icon_filename))
                 lbl.setPixmap(pix)
                 lbl.setToolTip(f"<b>{skill.name}</b><br>{skill.description}")
         
@@ -838,8 +939,7 @@ class BuildUniquenessDialog(QDialog):
             b = m['build']
             
             # Profession string
-            p1 = PROF_MAP.get(int(b.primary_prof) if b.primary_prof.isdigit() else 0, "X")
-            p2 = PROF_MAP.get(int(b.secondary_prof) if b.secondary_prof.isdigit() else 0, "X")
+            p1, p2 = b.prof_names
             
             text = f"[{score}/8 Matches] {p1}/{p2} - {b.team} ({b.category})"
             self.list_widget.addItem(text)
@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import (
     QTabWidget, QCheckBox, QPushButton, QFileDialog, QMessageBox, QFrame, QLineEdit, QApplication, QListWidgetItem, QListWidget, QSizePolicy, QGridLayout, QStyle, QProgressDialog, QStackedWidget
 )
 from PyQt6.QtCore import Qt, QTimer, QUrl, QThread, pyqtSignal, QSize, QSettings
-from PyQt6.QtGui import QIcon, QPixmap
+from PyQt6.QtGui import QIcon
 
 try:
     from PyQt6.QtWebEngineWidgets import QWebEngineView
@@ -14,13 +14,13 @@ try:
 except ImportError:
     HAS_WEBENGINE = False
 
-from src.constants import DB_FILE, JSON_FILE, PROF_MAP, PROF_SHORT_MAP, resource_path, ICON_DIR, ICON_SIZE, PIXMAP_CACHE, PROF_PRIMARY_ATTR, ATTR_MAP, PROF_ATTRS
+from src.constants import DB_FILE, JSON_FILE, PROF_MAP, PROF_SHORT_MAP, resource_path, ICON_SIZE, PROF_PRIMARY_ATTR, ATTR_MAP, PROF_ATTRS
 from src.database import SkillRepository
 from src.engine import MechanicsEngine, SynergyEngine
 from src.models import Build, Skill
 from src.utils import GuildWarsTemplateDecoder, GuildWarsTemplateEncoder
 from src.core.mechanics import get_primary_bonus_value
-from src.ui.components import SkillSlot, SkillInfoPanel, SkillLibraryWidget, BuildPreviewWidget
+from src.ui.components import SkillSlot, SkillInfoPanel, SkillLibraryWidget, BuildPreviewWidget, preview_button_qss, slot_qss, ICON_FILE_ROLE, set_interactive
 from src.ui.attribute_editor import AttributeEditor
 from src.ui.character_panel import CharacterPanel, WeaponsPanel, WEAPONS
 from src.ui.tutorial import TutorialOverlay, TutorialManager
@@ -60,7 +60,7 @@ class FilterWorker(QThread):
             if cat == "All" and team == "All":
                 valid_ids = local_repo.get_all_skill_ids(is_pvp=is_pvp)
             else:
-                valid_ids = self.engine.filter_skills(prof, cat, team) 
+                valid_ids = self.engine.filter_skills(prof, cat, team, builds=self.filters.get('builds'))
             
             filtered_skills = []
             target_prof_id = -1
@@ -237,6 +237,16 @@ class MainWindow(QMainWindow):
         self.filter_debounce_timer = QTimer()
         self.filter_debounce_timer.setSingleShot(True)
         self.filter_debounce_timer.timeout.connect(self._run_filter)
+        # Coalesces rapid icon size toggles into one resize pass
+        self.icon_size_timer = QTimer()
+        self.icon_size_timer.setSingleShot(True)
+        self.icon_size_timer.setInterval(50)
+        self.icon_size_timer.timeout.connect(self._apply_icon_size)
+        # Icons are fast-scaled while sizes change, then upgraded once things settle
+        self.icon_settle_timer = QTimer()
+        self.icon_settle_timer.setSingleShot(True)
+        self.icon_settle_timer.setInterval(300)
+        self.icon_settle_timer.timeout.connect(self._settle_icon_size)
         
         self.tutorial_manager = TutorialManager(self)
         self.init_ui()
@@ -382,22 +392,17 @@ class MainWindow(QMainWindow):
                 border: 1px solid {get_color('border')}; 
                 padding: 4px;
             }}
-        """)
+        """ + preview_button_qss() + slot_qss())
         
         # Propagate to Children
         self.refresh_theme()
         
-        if hasattr(self, 'library_widget'): self.library_widget.refresh_theme()
-        if hasattr(self, 'info_panel'): self.info_panel.refresh_theme()
+        # Library views, the info panel and build previews follow THEME_SIGNALS themselves
         if hasattr(self, 'attr_editor'): self.attr_editor.refresh_theme()
         if hasattr(self, 'character_panel'): self.character_panel.refresh_theme()
         if hasattr(self, 'weapons_panel'): self.weapons_panel.refresh_theme()
         if hasattr(self, 'settings_tab'): self.settings_tab.refresh_theme()
-        
-        # Refresh slots
-        if hasattr(self, 'slots'):
-            for slot in self.slots:
-                slot.refresh_theme()
+        # Slots restyle from slot_qss() in the app stylesheet above
                 
         # Force a repaint of the window to apply palette changes
         self.update()
@@ -512,7 +517,7 @@ class MainWindow(QMainWindow):
             return
             
         # Clone builds
-        source_builds = [b for b in self.engine.builds if b.team == current_team]
+        source_builds = self.engine.get_team_builds(current_team)
         self.engine.teams.add(new_name)
         
         for b in source_builds:
@@ -529,6 +534,7 @@ class MainWindow(QMainWindow):
             new_build.is_user_build = True
             self.engine.builds.append(new_build)
             
+        self.engine.invalidate_team_index()
         self.engine.save_user_builds()
         
         # Manual Refresh of Dropdown
@@ -823,7 +829,8 @@ class MainWindow(QMainWindow):
 
         # Page 2: Team View Panel
         self.team_view_widget = SkillLibraryWidget(repo=self.repo, engine=self.engine)
-        self.team_view_widget.builds_reordered.connect(self.handle_builds_reordered)
+        # Queued so the list is rebuilt after Qt has finished delivering the drop
+        self.team_view_widget.builds_reordered.connect(self.handle_builds_reordered, Qt.ConnectionType.QueuedConnection)
         self.team_view_widget.itemSelectionChanged.connect(self.on_team_list_selection_changed)
         self.center_stack.addWidget(self.team_view_widget)
         
@@ -1108,7 +1115,7 @@ class MainWindow(QMainWindow):
         if team_name == "All": return
         
         # Gather builds for this team
-        builds = [b for b in self.engine.builds if b.team == team_name]
+        builds = self.engine.get_team_builds(team_name)
         
         if not builds:
             QMessageBox.information(self, "Summary", "No builds found for this team.")
@@ -1127,7 +1134,7 @@ class MainWindow(QMainWindow):
         QApplication.processEvents()
         
         self.team_synergy_skills = []
-        builds = [b for b in self.engine.builds if b.team == team_name]
+        builds = self.engine.get_team_builds(team_name)
         
         all_ids = set()
         for b in builds:
@@ -1504,6 +1511,11 @@ class MainWindow(QMainWindow):
             'allowed_campaigns': self.get_allowed_campaigns()
         }
 
+        # A team filter is resolved on the worker thread, so hand it a snapshot of that
+        # team's builds rather than the live list and index
+        if target_team != "All":
+            filters['builds'] = self.engine.get_team_builds(target_team)
+
         self.filter_worker = FilterWorker(DB_FILE, self.engine, filters)
         self.filter_worker.finished.connect(self._on_filter_finished)
         self.filter_worker.start()
@@ -1535,7 +1547,7 @@ class MainWindow(QMainWindow):
         # We target the Team View (Center) via _populate_build_list
         # Left Panel (Skills) remains untouched here (handled by FilterWorker)
         
-        matching_builds = [b for b in self.engine.builds if b.team == team_name]
+        matching_builds = self.engine.get_team_builds(team_name)
         matching_builds = self._apply_profession_filter(matching_builds)
         matching_builds = self._apply_name_filter(matching_builds)
         
@@ -1762,7 +1774,7 @@ class MainWindow(QMainWindow):
         
         # 1. Get the list of builds currently visible
         if team_name != "All":
-            matching_builds = [b for b in self.engine.builds if b.team == team_name]
+            matching_builds = self.engine.get_team_builds(team_name)
             if cat_name != "All":
                 matching_builds = [b for b in matching_builds if b.category == cat_name]
         else:
@@ -1789,6 +1801,7 @@ class MainWindow(QMainWindow):
         for idx, build in zip(global_indices, matching_builds):
             self.engine.builds[idx] = build
             build.is_user_build = True
+        self.engine.invalidate_team_index()
 
         # 5. Save and Refresh
         self.engine.save_user_builds()
@@ -1816,24 +1829,7 @@ class MainWindow(QMainWindow):
             item = QListWidgetItem(skill.name)
             item.setData(Qt.ItemDataRole.UserRole, skill.id)
             item.setData(Qt.ItemDataRole.DisplayRole, skill.name) # Explicitly set display role for delegate
-            
-            # Icon Loading (Size-Aware Caching)
-            cache_key = f"{skill.icon_filename}_{current_size}"
-            pix = None
-            
-            if cache_key in PIXMAP_CACHE:
-                pix = PIXMAP_CACHE[cache_key]
-            else:
-                path = os.path.join(ICON_DIR, skill.icon_filename)
-                if os.path.exists(path):
-                    pix = QPixmap(path)
-                    # Cache based on current magnification size
-                    pix = pix.scaled(current_size, current_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    PIXMAP_CACHE[cache_key] = pix
-            
-            if pix:
-                item.setIcon(QIcon(pix))
-                item.setData(Qt.ItemDataRole.DecorationRole, QIcon(pix)) # Ensure delegate gets the icon
+            item.setData(ICON_FILE_ROLE, skill.icon_filename) # Painted from the pixmap cache on demand
             
             self.library_widget.addItem(item)
             
@@ -2479,6 +2475,11 @@ class MainWindow(QMainWindow):
             self.process_folder_drop(folder_path)
 
     def toggle_icon_size(self):
+        set_interactive(True)
+        self.icon_settle_timer.stop()
+        self.icon_size_timer.start()
+
+    def _apply_icon_size(self):
         checked = self.btn_max_icons.isChecked()
         new_size = 128 if checked else 64
         self.library_widget.set_icon_size(new_size)
@@ -2486,6 +2487,16 @@ class MainWindow(QMainWindow):
             self.character_panel.set_icon_size(new_size)
         if hasattr(self, 'weapons_panel'):
             self.weapons_panel.set_icon_size(new_size)
+        self.icon_settle_timer.start()
+
+    def _settle_icon_size(self):
+        # Swap the fast in-flight scales for smooth ones
+        if set_interactive(False):
+            self.library_widget.refresh_icons()
+            self.team_view_widget.refresh_icons()
+            for slot in self.slots:
+                slot.refresh_icon()
+            self.info_panel.refresh_icon()
 
     def toggle_character_view(self, checked):
         if checked:
@@ -2568,6 +2579,7 @@ class MainWindow(QMainWindow):
                     print(f"Error processing {filename}: {e}")
 
         if added_count > 0:
+            self.engine.invalidate_team_index()
             self.engine.teams.add(team_name)
             self.engine.save_user_builds()
             self.update_team_dropdown()
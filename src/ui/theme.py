@@ -1,6 +1,6 @@
 from PyQt6.QtGui import QColor, QPalette, QGuiApplication
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, pyqtSignal
 
 # --- COLOR DEFINITIONS ---
 DARK_PALETTE = {
@@ -77,16 +77,32 @@ LIGHT_PALETTE = {
 
 # Current Active Theme (Starts with Dark as default match)
 CURRENT_THEME = DARK_PALETTE.copy()
+# Bumped by update_theme so caches of themed pixmaps/styles can tell when they are stale
+THEME_GEN = 0
+
+class _ThemeSignals(QObject):
+    theme_changed = pyqtSignal()
+
+# Widgets connect to THEME_SIGNALS.theme_changed once instead of being walked on every change
+THEME_SIGNALS = _ThemeSignals()
 
 def get_color(key):
     return CURRENT_THEME.get(key, "#FF00FF") # Magenta fallback
 
+def get_theme_snapshot():
+    """
+    Returns a copy of the active color dict for bulk lookups (e.g. a whole stylesheet).
+    Later theme changes don't affect it, so call again after theme_changed.
+    """
+    return dict(CURRENT_THEME)
+
 def update_theme(mode):
     """
     Updates CURRENT_THEME and returns a QPalette for the application.
     mode: 'Dark', 'Light', or 'Auto'
     """
-    global CURRENT_THEME
+    global CURRENT_THEME, THEME_GEN
+    THEME_GEN += 1
     
     is_dark = True
     if mode == "Light":
@@ -106,11 +122,13 @@ def update_theme(mode):
     if is_dark:
         CURRENT_THEME.clear()
         CURRENT_THEME.update(DARK_PALETTE)
-        return _get_dark_qpalette()
+        palette = _get_dark_qpalette()
     else:
         CURRENT_THEME.clear()
         CURRENT_THEME.update(LIGHT_PALETTE)
-        return _get_light_qpalette()
+        palette = _get_light_qpalette()
+    THEME_SIGNALS.theme_changed.emit()
+    return palette
 
 def _get_dark_qpalette():
     p = QPalette()
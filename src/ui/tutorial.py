@@ -528,7 +528,7 @@ class TutorialManager:
             self.mw.combo_team.blockSignals(False)
 
         # RECREATE
-        source_builds = [b for b in self.mw.engine.builds if b.team == current_team]
+        source_builds = self.mw.engine.get_team_builds(current_team)
         if source_builds:
             self.mw.engine.teams.add(new_name)
             from src.models import Build
@@ -545,6 +545,7 @@ class TutorialManager:
                 )
                 new_build.is_user_build = True
                 self.mw.engine.builds.append(new_build)
+            self.mw.engine.invalidate_team_index()
             self.mw.engine.save_user_builds()
             
             # Refresh main window dropdowns silently
@@ -575,6 +576,8 @@ class TutorialManager:
             if self.mw.team_view_widget.count() > 0:
                 item = self.mw.team_view_widget.item(0)
                 widget = self.mw.team_view_widget.itemWidget(item)
+                if isinstance(widget, BuildPreviewWidget):
+                    widget.ensure_built() # Buttons are built lazily on first paint
                 if widget and hasattr(widget, 'btn_edit'):
                     target = widget.btn_edit
             